@@ -0,0 +1,55 @@
+import sys
+import timeit
+
+from flask_schema import types
+
+DATETIMES = [
+    "2018-12-26T00:00:00.000",
+    "2018-12-26T00:00:00.000-10:00",
+    "2018-12-26T00:00:00.000Z",
+    "2018-12-26T00:00:00.000$10:00",
+    "2018-12-26T13:45:30.123456+05:30",
+]
+DATES = ["2018-12-26", "2018-12-26T00:00:00.000", "2018-13-26"]
+
+
+def _outcome(parser, value):
+    try:
+        return parser(value)
+    except ValueError as ex:
+        return type(ex)
+
+
+def _compare(name, fast, reference, values, number):
+    for value in values:
+        if _outcome(fast, value) != _outcome(reference, value):
+            sys.exit(f"{name}: parsers disagree on {value!r}")
+    fast_time = timeit.timeit(
+        lambda: [_outcome(fast, v) for v in values], number=number
+    )
+    reference_time = timeit.timeit(
+        lambda: [_outcome(reference, v) for v in values], number=number
+    )
+    print(
+        f"{name}: strptime {reference_time:.3f}s, "
+        f"fast {fast_time:.3f}s ({reference_time / fast_time:.1f}x)"
+    )
+
+
+def _reference_date(value):
+    return types.Date._parse_strptime(value.split("T")[0])
+
+
+def main(number=20000):
+    _compare(
+        "DateTime",
+        types.DateTime._parse_datetime,
+        types.DateTime._parse_strptime,
+        DATETIMES,
+        number,
+    )
+    _compare("Date", types.Date._parse_date, _reference_date, DATES, number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import datetime
+import tracemalloc
+
+from flask_schema import types
+
+FACTORIES = {
+    "Property": lambda cls: cls(int),
+    "Number": lambda cls: cls(min_value=0, max_value=10),
+    "Int": lambda cls: cls(min_value=0),
+    "Bool": lambda cls: cls(),
+    "String": lambda cls: cls(max_length=32),
+    "Regex": lambda cls: cls("[a-z]+"),
+    "Email": lambda cls: cls(),
+    "Uuid": lambda cls: cls(),
+    "Date": lambda cls: cls(max_value=datetime.date.today),
+    "DateTime": lambda cls: cls(),
+    "Array": lambda cls: cls(types.Int(), max_length=8),
+}
+
+
+def _slot_names(cls):
+    return [
+        name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())
+    ]
+
+
+# Instances laid out as before __slots__: every attribute lives in __dict__.
+def _unslotted(cls):
+    slotted = type(cls.__name__, (cls,), {})
+
+    def factory(*args, **kwargs):
+        instance = slotted(*args, **kwargs)
+        for name in _slot_names(cls):
+            instance.__dict__[name] = getattr(instance, name)
+            delattr(instance, name)
+        return instance
+
+    return factory
+
+
+def _footprint(factory, cls, number):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [factory(cls) for _ in range(number)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del instances
+    return size / number
+
+
+def main(number=10000):
+    print(f"{'type':<10} {'__dict__':>10} {'__slots__':>10}")
+    for name, factory in FACTORIES.items():
+        cls = getattr(types, name)
+        with_dict = _footprint(factory, _unslotted(cls), number)
+        with_slots = _footprint(factory, cls, number)
+        print(f"{name:<10} {with_dict:>9.0f}B {with_slots:>9.0f}B")
+
+
+if __name__ == "__main__":
+    main()
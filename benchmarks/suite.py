@@ -0,0 +1,195 @@
+import os
+import sys
+import json
+import timeit
+import argparse
+import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+import flask
+
+from flask_schema import types, errors, decorators
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "default.json")
+
+
+class Address(types.Schema):
+    street = types.String(min_length=1, max_length=64, nullable=False)
+    city = types.String(min_length=1, max_length=32, nullable=False)
+    postcode = types.Regex("[A-Z0-9 ]{5,8}")
+    country = types.Choice(["GB", "FR", "DE", "US"])
+
+
+class LineItem(types.Schema):
+    sku = types.Uuid(nullable=False)
+    quantity = types.Int(min_value=1, max_value=100, default=1)
+    price = types.Float(min_value=0.0)
+    tags = types.Array(types.String(max_length=16), max_length=8)
+
+
+class Order(types.Schema):
+    __strict__ = True
+    id = types.Uuid(nullable=False)
+    email = types.Email(nullable=False)
+    placed = types.DateTime(nullable=False)
+    delivery = types.Date()
+    paid = types.Bool(default=False)
+    billing = types.Object(Address)
+    shipping = types.Object(Address)
+    items = types.Array(types.Object(LineItem), min_length=1, max_length=100)
+
+
+ADDRESS = {"street": "1 High St", "city": "London", "postcode": "SW1A 1AA"}
+ITEM = {
+    "sku": "9689c6bd-8cfa-4888-a92c-7d23599b94aa",
+    "quantity": 2,
+    "price": 9.99,
+    "tags": ["red", "large"],
+}
+
+
+def order(items: int) -> Dict[str, Any]:
+    return {
+        "id": "8a2f0c0e-56b1-4b1c-9f5e-0d9d6c9f1a2b",
+        "email": "someone@example.com",
+        "placed": "2018-12-26T13:45:30.123456+05:30",
+        "delivery": "2018-12-28",
+        "paid": True,
+        "billing": dict(ADDRESS, country="GB"),
+        "shipping": dict(ADDRESS),
+        "items": [dict(ITEM) for _ in range(items)],
+    }
+
+
+def _quiet(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def _call(value: Any) -> Any:
+        try:
+            return func(value)
+        except errors.SchemaValidationError as ex:
+            return ex
+
+    return _call
+
+
+def _protect_client() -> Callable[[Any], Any]:
+    app = flask.Flask("benchmarks")
+
+    @app.route("/orders", methods=["POST"])
+    @decorators.SchemaProtect(Order)
+    def _create(body):
+        return "", 204
+
+    @app.errorhandler(errors.SchemaValidationError)
+    def _invalid(ex):
+        return flask.jsonify(ex.to_dict()), 400
+
+    client = app.test_client()
+    return lambda value: client.post("/orders", json=value)
+
+
+def cases() -> Dict[str, Tuple[Callable[[Any], Any], Any]]:
+    today = datetime.date(2020, 1, 1)
+    numbers = list(range(1000))
+    table = {
+        "Int/valid": (types.Int(min_value=0, max_value=100), 42),
+        "Int/invalid": (types.Int(min_value=0, max_value=100), 420),
+        "Float/valid": (types.Float(max_value=lambda: 10.0), 2.5),
+        "Float/invalid": (types.Float(), "2.5"),
+        "String/valid": (types.String(min_length=1, max_length=32), "hello"),
+        "String/invalid": (types.String(max_length=3), "hello"),
+        "Regex/valid": (types.Regex("[a-z]+-[0-9]+"), "order-123"),
+        "Regex/invalid": (types.Regex("[a-z]+-[0-9]+"), "ORDER-123"),
+        "Email/valid": (types.Email(), "someone@example.com"),
+        "Email/invalid": (types.Email(), "someone.example.com"),
+        "Uuid/valid": (types.Uuid(), "9689c6bd-8cfa-4888-a92c-7d23599b94aa"),
+        "Uuid/invalid": (types.Uuid(), "9689c6bd-8cfa-4888-a92c-7d23599b94"),
+        "Date/valid": (types.Date(max_value=today), "2018-12-26"),
+        "Date/invalid": (types.Date(), "2018-13-26"),
+        "DateTime/valid": (types.DateTime(), "2018-12-26T13:45:30.123+05:30"),
+        "DateTime/invalid": (types.DateTime(), "2018-12-26 13:45"),
+        "Choice/valid": (types.Choice(["a", "b", types.Int()]), 3),
+        "Choice/invalid": (types.Choice(["a", "b", types.Int()]), 3.5),
+        "Array/valid": (types.Array(types.Int(min_value=0)), numbers),
+        "Array/invalid": (types.Array(types.Int(min_value=0)), numbers + [-1]),
+        "Object/valid": (types.Object(Address), dict(ADDRESS)),
+        "Object/invalid": (types.Object(Address), dict(ADDRESS, city="")),
+        "Schema/order-1": (Order(), order(1)),
+        "Schema/order-100": (Order(), order(100)),
+        "Schema/order-invalid": (Order(), dict(order(100), paid="yes")),
+        "Schema/compiled-order-100": (Order.compile(), order(100)),
+    }
+    protect = _protect_client()
+    table["SchemaProtect/order-10"] = (protect, order(10))
+    table["SchemaProtect/order-invalid"] = (protect, dict(order(10), email="x"))
+    return {name: (_quiet(func), value) for name, (func, value) in table.items()}
+
+
+def measure(func: Callable[[Any], Any], value: Any, repeat: int) -> float:
+    timer = timeit.Timer(lambda: func(value))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def run(pattern: str = "", repeat: int = 5, echo: bool = True) -> Dict[str, float]:
+    results = {}
+    for name, (func, value) in cases().items():
+        if pattern in name:
+            results[name] = measure(func, value, repeat)
+            if echo:
+                print(f"{name:<32} {results[name]:>10.2f}us")
+    return results
+
+
+def compare(
+    baseline: Dict[str, float], results: Dict[str, float], threshold: float
+) -> List[str]:
+    regressions = []
+    print(f"{'case':<32} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<32} {'-':>12} {current:>10.2f}us {'new':>8}")
+            continue
+        change = current / previous - 1
+        print(f"{name:<32} {previous:>10.2f}us {current:>10.2f}us {change:>+8.1%}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument("command", choices=["run", "save", "compare"])
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--filter", default="", help="only run matching cases")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown (0.1 = 10%%)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.baseline) as stream:
+            baseline = json.load(stream)["results"]
+        regressions = compare(
+            baseline, run(args.filter, args.repeat, echo=False), args.threshold
+        )
+        if regressions:
+            print(f"regressions: {', '.join(regressions)}")
+        return 1 if regressions else 0
+
+    results = run(args.filter, args.repeat)
+    if args.command == "save":
+        with open(args.baseline, "w") as stream:
+            json.dump(
+                {"python": sys.version.split()[0], "results": results},
+                stream,
+                indent=2,
+                sort_keys=True,
+            )
+            stream.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
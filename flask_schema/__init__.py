@@ -1,6 +1,7 @@
 from . import types, errors, decorators
 
 schema_protect = decorators.SchemaProtect
+schema_response = decorators.SchemaResponse
 custom_property = decorators.CustomProperty
 
 # types
@@ -8,3 +9,11 @@ schema = types
 
 # errors
 SchemaValidationError = errors.SchemaValidationError
+WrongType = errors.WrongType
+OutOfRange = errors.OutOfRange
+NotNullable = errors.NotNullable
+NoMatch = errors.NoMatch
+UnknownField = errors.UnknownField
+InvalidChoice = errors.InvalidChoice
+InvalidFormat = errors.InvalidFormat
+TooLarge = errors.TooLarge
@@ -0,0 +1,99 @@
+import json
+import uuid
+import datetime
+import collections.abc
+from typing import Any, Callable, Dict, Tuple, Union
+
+from . import errors
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+BACKENDS = ("orjson", "msgspec", "ujson", "json")
+
+DECODERS: Dict[str, Tuple[Callable[[bytes], Any], Tuple[type, ...]]] = {
+    "json": (json.loads, (ValueError,))
+}
+if orjson is not None:
+    DECODERS["orjson"] = (orjson.loads, (orjson.JSONDecodeError,))
+if msgspec is not None:  # pragma: no cover
+    DECODERS["msgspec"] = (msgspec.json.decode, (msgspec.DecodeError,))
+if ujson is not None:  # pragma: no cover
+    DECODERS["ujson"] = (ujson.loads, (ValueError,))
+
+
+def _wrap(
+    decode: Callable[[bytes], Any], failures: Tuple[type, ...]
+) -> Callable[[bytes], Any]:
+    def _decode(data: bytes) -> Any:
+        try:
+            return decode(data)
+        except failures as ex:
+            raise errors.InvalidFormat(f"malformed JSON: {ex}")
+
+    return _decode
+
+
+_decoders: Dict[Any, Callable[[bytes], Any]] = {}
+
+
+def get_decoder(backend: Union[str, Callable[[bytes], Any]]) -> Callable[[bytes], Any]:
+    decoder = _decoders.get(backend)
+    if decoder is not None:
+        return decoder
+    if callable(backend):
+        decoder = _wrap(backend, (ValueError,))
+    elif backend == "auto":
+        name = next(name for name in BACKENDS if name in DECODERS)
+        decoder = _wrap(*DECODERS[name])
+    elif backend in BACKENDS:
+        decoder = _wrap(*DECODERS.get(backend, DECODERS["json"]))
+    else:
+        raise ValueError(f"unknown JSON backend {backend!r}")
+    _decoders[backend] = decoder
+    return decoder
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, collections.abc.Mapping):
+        return dict(value)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _json_encode(value: Any) -> bytes:
+    return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+
+ENCODERS: Dict[str, Callable[[Any], bytes]] = {"json": _json_encode}
+if orjson is not None:
+    ENCODERS["orjson"] = lambda value: orjson.dumps(value, default=_default)
+if msgspec is not None:  # pragma: no cover
+    ENCODERS["msgspec"] = msgspec.json.Encoder(enc_hook=_default).encode
+
+
+def get_encoder(backend: Union[str, Callable[[Any], bytes]]) -> Callable[[Any], bytes]:
+    if callable(backend):
+        return backend
+    if backend == "auto":
+        return next(ENCODERS[name] for name in BACKENDS if name in ENCODERS)
+    if backend in BACKENDS:
+        return ENCODERS.get(backend, _json_encode)
+    raise ValueError(f"unknown JSON backend {backend!r}")
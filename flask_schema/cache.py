@@ -0,0 +1,82 @@
+import copy
+import time
+import hashlib
+import threading
+import collections
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from . import types
+
+
+def cacheable(rule: Any) -> bool:
+    if isinstance(rule, types.Schema):
+        rule = rule._root
+    if not isinstance(rule, types.Property):
+        return False
+    if callable(rule.default) or rule.callback is not None:
+        return False
+    prop_range = getattr(rule, "range", None)
+    if prop_range is not None and prop_range.dynamic:
+        return False
+    if isinstance(rule, types.Object):
+        return all(cacheable(field) for field in rule.schema.values())
+    if isinstance(rule, types.Array):
+        return cacheable(rule.schema)
+    if isinstance(rule, types.Choice):
+        branches = rule.tags.values() if rule.tags is not None else rule.choices
+        return all(cacheable(branch) for branch in branches if callable(branch))
+    return True
+
+
+class ValidationCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, Tuple[float, Any]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def key(cls, rule: Any, body: bytes) -> Tuple[int, bytes]:
+        return id(rule), hashlib.blake2b(body, digest_size=16).digest()
+
+    def _get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                self.ttl is None or time.monotonic() - entry[0] < self.ttl
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def _set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_validate(
+        self, rule: Any, body: bytes, validate: Callable[[], Any]
+    ) -> Any:
+        key = self.key(rule, body)
+        hit, value = self._get(key)
+        if not hit:
+            value = validate()
+            self._set(key, copy.deepcopy(value))
+            return value
+        return copy.deepcopy(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
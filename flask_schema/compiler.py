@@ -0,0 +1,141 @@
+import itertools
+from typing import Any, Callable, Dict, List, Union
+
+from . import types
+
+_SCALARS = (
+    types.Property,
+    types.Number,
+    types.Int,
+    types.Float,
+    types.Bool,
+    types.String,
+)
+
+
+class _Builder:
+    def __init__(self):
+        self.namespace: Dict[str, Any] = {}
+        self.functions: List[str] = []
+        self.compiled: Dict[int, str] = {}
+        self.counter = itertools.count()
+        self.dynamic = False
+
+    def bind(self, value: Any, prefix: str = "_v") -> str:
+        name = f"{prefix}{next(self.counter)}"
+        self.namespace[name] = value
+        return name
+
+    def _bounds(self, prop: types.Property, subject: str) -> List[str]:
+        prop_range = getattr(prop, "range", None)
+        if prop_range is None:
+            return []
+        if prop_range.dynamic:
+            self.dynamic = True
+            return [f"{self.bind(prop_range.compare, '_r')}({subject})"]
+        conditions = []
+        if prop_range.min is not None:
+            conditions.append(f"{self.bind(prop_range.min, '_lo')} <= {subject}")
+        if prop_range.max is not None:
+            conditions.append(f"{subject} <= {self.bind(prop_range.max, '_hi')}")
+        return conditions
+
+    def condition(self, prop: Any, var: str) -> Union[str, None]:
+        if type(prop) not in _SCALARS or prop.callback is not None:
+            return None
+        if prop.types:
+            conditions = [
+                f"{var}.__class__ in {self.bind(frozenset(prop.types), '_t')}"
+            ]
+        else:
+            conditions = [f"{var} is not None"]
+        subject = f"len({var})" if isinstance(prop, types.String) else var
+        conditions.extend(self._bounds(prop, subject))
+        return " and ".join(conditions)
+
+    def function(self, prop: Any) -> Union[str, None]:
+        if type(prop) not in (types.Object, types.Array):
+            return None
+        if prop.callback is not None or prop.collect_errors:
+            return None
+        if type(prop) is types.Array and prop.bulk:
+            return None
+        if type(prop) is types.Object and (prop.lazy or prop.metrics is not None):
+            return None
+        builder = self._object if type(prop) is types.Object else self._array
+        name = self.compiled.get(id(prop))
+        if name is None:
+            name = self.compiled[id(prop)] = f"_f{next(self.counter)}"
+            self.functions.append(builder(name, prop))
+        return name
+
+    def _object(self, name: str, prop: types.Object) -> str:
+        fallback = self.bind(prop, "_p")
+        lines = [
+            f"def {name}(value):",
+            "    if value.__class__ is not dict:",
+            f"        return {fallback}(value)",
+        ]
+        if prop.strict:
+            keys = self.bind(frozenset(prop.schema), "_k")
+            lines.extend(
+                [
+                    "    for key in value:",
+                    f"        if key not in {keys}:",
+                    f"            return {fallback}(value)",
+                ]
+            )
+        lines.append("    get = value.get")
+        result = []
+        for index, (key, field) in enumerate(prop.schema.items()):
+            var = f"v{index}"
+            lines.append(f"    {var} = get({key!r})")
+            lines.extend(f"    {line}" for line in self.statement(field, var))
+            result.append(f"{key!r}: {var}")
+        lines.append(f"    return {{{', '.join(result)}}}")
+        return "\n".join(lines)
+
+    def _array(self, name: str, prop: types.Array) -> str:
+        fallback = self.bind(prop, "_p")
+        guard = " and ".join(
+            ["value.__class__ is list"] + self._bounds(prop, "len(value)")
+        )
+        item = self.expression(prop.schema, "item")
+        return "\n".join(
+            [
+                f"def {name}(value):",
+                f"    if not ({guard}):",
+                f"        return {fallback}(value)",
+                f"    return [{item} for item in value]",
+            ]
+        )
+
+    def expression(self, prop: Any, var: str) -> str:
+        function = self.function(prop)
+        if function is not None:
+            return f"{function}({var})"
+        condition = self.condition(prop, var)
+        if condition is not None:
+            return f"{var} if {condition} else {self.bind(prop, '_p')}({var})"
+        return f"{self.bind(prop, '_p')}({var})"
+
+    def statement(self, prop: Any, var: str) -> List[str]:
+        condition = self.condition(prop, var)
+        if condition is not None:
+            return [
+                f"if not ({condition}):",
+                f"    {var} = {self.bind(prop, '_p')}({var})",
+            ]
+        return [f"{var} = {self.expression(prop, var)}"]
+
+
+def compile_property(prop: Any) -> Callable[[Any], Any]:
+    builder = _Builder()
+    name = builder.function(prop)
+    if name is None:
+        return prop
+    source = "\n\n".join(builder.functions)
+    code = compile(source, f"<flask_schema.compiled {name}>", "exec")
+    exec(code, builder.namespace)  # nosec - source is generated from field names
+    function = builder.namespace[name]
+    return types._scoped(function) if builder.dynamic else function
@@ -1,7 +1,13 @@
+import time
+import random
+import asyncio
+import inspect
 import functools
-from typing import Any, Callable, ClassVar, Union, Type
+import concurrent.futures
+from typing import IO, Any, Callable, ClassVar, Dict, Iterator, Tuple, Union, Type
 import flask
-from . import types, errors
+import werkzeug.exceptions
+from . import types, errors, backends, compiler, stream, cache, params
 
 
 class SchemaProtect:
@@ -14,34 +20,296 @@ class SchemaProtect:
             Type[types.Property],
             types.Property,
             None,
-        ],
+        ] = None,
+        compiled: bool = False,
+        stream: bool = False,
+        max_content_length: int = None,
+        json_backend: Union[str, Callable[[bytes], Any], None] = None,
+        cache_size: int = None,
+        cache_ttl: float = None,
+        metrics: Callable = None,
+        format: str = "json",
+        offload_size: int = None,
+        executor: concurrent.futures.Executor = None,
+        query: Union[Type[types.Schema], types.Schema, types.Object] = None,
+        headers: Union[Type[types.Schema], types.Schema, types.Object] = None,
     ):
         if isinstance(rule, type) and issubclass(rule, (types.Property, types.Schema)):
             rule = rule()
+        if format not in ("json", "ndjson"):
+            raise ValueError(f"unknown request format {format!r}")
+        if cache_size and (stream or format == "ndjson"):
+            raise ValueError("cache_size cannot be combined with streamed bodies")
+        if format == "ndjson" and not isinstance(rule, types.Array):
+            raise TypeError("ndjson requests need an Array rule")
+        if format == "ndjson" and rule.as_array is not None:
+            raise TypeError("ndjson requests cannot use as_array")
+        if isinstance(executor, concurrent.futures.ProcessPoolExecutor) and (
+            not isinstance(rule, types.Schema)
+        ):
+            raise TypeError("process executors need a Schema rule")
         self.rule = rule
+        self.format = format
+        self.validate = self._validator(
+            rule.schema if format == "ndjson" else rule, compiled
+        )
+        self.stream = stream
+        self.cache = (
+            cache.ValidationCache(cache_size, cache_ttl)
+            if cache_size and cache.cacheable(rule)
+            else None
+        )
+        self.metrics = metrics
+        self.offload_size = offload_size
+        self.executor = executor
+        self.query = self._params(params.QueryParams, query, compiled)
+        self.headers = self._params(params.HeaderParams, headers, compiled)
+        self.max_content_length = max_content_length
+        self.decode = (
+            None if json_backend is None else backends.get_decoder(json_backend)
+        )
+
+    @classmethod
+    def _validator(cls, rule: Any, compiled: bool) -> Union[Callable, None]:
+        if not isinstance(rule, (types.Property, types.Schema)):
+            return None
+        if not compiled:
+            return rule
+        if isinstance(rule, types.Schema):
+            return rule._get_compiled()
+        return compiler.compile_property(rule)
+
+    @classmethod
+    def _params(
+        cls, kind: Type[params.Params], schema: Any, compiled: bool
+    ) -> Union[params.Params, None]:
+        if schema is None:
+            return None
+        obj = params._object(schema)
+        return kind(obj, cls._validator(obj, compiled))
+
+    def _request_params(self) -> Dict[str, Any]:
+        values = {}
+        if self.query is not None:
+            values["query"] = self.query(flask.request.query_string)
+        if self.headers is not None:
+            values["headers"] = self.headers(flask.request.environ)
+        return values
+
+    def _decoder(self) -> Union[Callable[[bytes], Any], None]:
+        if self.decode is not None or not flask.has_app_context():
+            return self.decode
+        backend = flask.current_app.config.get("SCHEMA_JSON_BACKEND")
+        return None if backend is None else backends.get_decoder(backend)
+
+    def _json(self) -> Any:
+        decode = self._decoder()
+        if decode is None:
+            try:
+                return flask.request.json
+            except werkzeug.exceptions.BadRequest:
+                raise errors.InvalidFormat("malformed JSON")
+        if not flask.request.is_json:
+            return None
+        return decode(flask.request.get_data(cache=False))
 
     @property
     def request_body(self):
         if self.rule is True:
             if not flask.request.is_json:
-                raise errors.SchemaValidationError()  # TODO expected json
-            return flask.request.json
+                raise errors.SchemaValidationError(code="expected_json")
+            return self._json()
         if self.rule is False:
             if flask.request.is_json:
-                raise errors.SchemaValidationError()  # TODO unexpected json
+                raise errors.SchemaValidationError(code="unexpected_json")
             return None
         if self.rule is None:
             if flask.request.is_json:
-                return flask.request.json
+                return self._json()
             return None
-        if isinstance(self.rule, (types.Property, types.Schema)):
-            return self.rule(flask.request.json)
-        raise errors.SchemaValidationError()  # TODO unknown rule type
+        if self.format == "ndjson":
+            return self._ndjson_body()
+        if self.validate is not None and self.stream:
+            return self._stream_body()
+        if self.validate is not None and self.cache is not None and (
+            flask.request.is_json
+        ):
+            return self.cache.get_or_validate(
+                self.rule,
+                flask.request.get_data(),
+                lambda: self.validate(self._json()),
+            )
+        if self.validate is not None:
+            return self.validate(self._json())
+        raise errors.SchemaValidationError(code="unknown_rule")
+
+    def _check_length(self):
+        length = flask.request.content_length
+        if (
+            self.max_content_length is not None
+            and (length or 0) > self.max_content_length
+        ):
+            raise errors.TooLarge(maximum=self.max_content_length)
+
+    def _stream_body(self) -> Any:
+        if not flask.request.is_json:
+            return self.rule(None)
+        self._check_length()
+        return stream.validate(
+            flask.request.stream, self.rule, max_size=self.max_content_length
+        )
+
+    def _ndjson_body(self) -> Iterator[Any]:
+        self._check_length()
+        decode = self._decoder() or backends.get_decoder("json")
+        return self._records(flask.request.stream, decode)
+
+    def _records(
+        self, body: IO[bytes], decode: Callable[[bytes], Any]
+    ) -> Iterator[Any]:
+        minimum, maximum = self.rule.range.bounds()
+        size = count = 0
+        for line in body:
+            size += len(line)
+            if self.max_content_length is not None and size > self.max_content_length:
+                raise errors.TooLarge(maximum=self.max_content_length)
+            if not line.strip():
+                continue
+            if maximum is not None and count >= maximum:
+                raise self.rule.range.error()
+            try:
+                record = self.validate(decode(line))
+            except errors.SchemaValidationError as ex:
+                raise ex.at(count)
+            yield record
+            count += 1
+        if minimum is not None and count < minimum:
+            raise self.rule.range.error()
+
+    def _offloads(self) -> bool:
+        return (
+            self.offload_size is not None
+            and self.validate is not None
+            and self.format == "json"
+            and not self.stream
+            and self.cache is None
+            and (flask.request.content_length or 0) > self.offload_size
+        )
+
+    async def _async_body(self) -> Any:
+        if not self._offloads():
+            return self.request_body
+        value = self._json()
+        loop = asyncio.get_event_loop()
+        if not isinstance(self.executor, concurrent.futures.ProcessPoolExecutor):
+            return await loop.run_in_executor(self.executor, self.validate, value)
+        ok, value, error = await loop.run_in_executor(
+            self.executor, types._validate_one, type(self.rule), value
+        )
+        if not ok:
+            raise error
+        return value
+
+    def _record(self, name: str, start: float, error: Any = None):
+        self.metrics(name, None, time.perf_counter() - start, error)
+
+    def _observed_body(self, name: str) -> Any:
+        start = time.perf_counter()
+        try:
+            body = self.request_body
+        except errors.SchemaValidationError as ex:
+            self._record(name, start, ex)
+            raise
+        self._record(name, start)
+        return body
+
+    async def _observed_async_body(self, name: str) -> Any:
+        start = time.perf_counter()
+        try:
+            body = await self._async_body()
+        except errors.SchemaValidationError as ex:
+            self._record(name, start, ex)
+            raise
+        self._record(name, start)
+        return body
+
+    def __call__(self, func: Callable) -> Callable:
+        name = func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def _async_call(*args: Any, **kwargs: Any) -> Any:
+                if self.metrics is None:
+                    body = await self._async_body()
+                else:
+                    body = await self._observed_async_body(name)
+                return await func(body, *args, **kwargs, **self._request_params())
+
+            return _async_call
+
+        @functools.wraps(func)
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            if self.metrics is None:
+                body = self.request_body
+            else:
+                body = self._observed_body(name)
+            return func(body, *args, **kwargs, **self._request_params())
+
+        return _call
+
+
+class SchemaResponse:
+    def __init__(
+        self,
+        rule: Union[
+            Type[types.Schema], types.Schema, Type[types.Property], types.Property
+        ],
+        sample_rate: float = 1.0,
+        json_backend: Union[str, Callable[[Any], bytes]] = "auto",
+        compiled: bool = False,
+    ):
+        if isinstance(rule, type) and issubclass(rule, (types.Property, types.Schema)):
+            rule = rule()
+        self.rule = rule
+        self.validate = SchemaProtect._validator(rule, compiled)
+        self.sample_rate = sample_rate
+        self.encode = backends.get_encoder(json_backend)
+
+    def _sampled(self) -> bool:
+        if self.sample_rate >= 1:
+            return True
+        return random.random() < self.sample_rate  # nosec - sampling, not security
+
+    @classmethod
+    def _unpack(cls, value: Any) -> Tuple[Any, Any, Any]:
+        if not isinstance(value, tuple):
+            return value, None, None
+        if len(value) == 2 and isinstance(value[1], (dict, list)):
+            return value[0], None, value[1]
+        return (value + (None, None))[:3]
+
+    def response(self, value: Any) -> flask.Response:
+        value, status, headers = self._unpack(value)
+        if isinstance(value, flask.Response):
+            if status is not None:
+                value.status = status if isinstance(status, str) else str(status)
+            if headers:
+                value.headers.update(headers)
+            return value
+        if self._sampled():
+            self.validate(value)
+        return flask.Response(
+            self.encode(value),
+            status=status,
+            headers=headers,
+            mimetype="application/json",
+        )
 
     def __call__(self, func: Callable) -> Callable:
         @functools.wraps(func)
         def _call(*args: Any, **kwargs: Any) -> Any:
-            return func(self.request_body, *args, **kwargs)
+            return self.response(func(*args, **kwargs))
 
         return _call
 
@@ -1,2 +1,73 @@
+from typing import Any, Dict, List, Sequence, Union
+
+
 class SchemaValidationError(ValueError):
-    pass
+    code = "invalid"
+
+    def __init__(
+        self,
+        message: str = None,
+        code: str = None,
+        path: Sequence[Union[str, int]] = (),
+        errors: List["SchemaValidationError"] = None,
+        **constraints: Any,
+    ):
+        if code is not None:
+            self.code = code
+        super(SchemaValidationError, self).__init__(message or self.code)
+        self.path = tuple(path)
+        self.errors = errors if errors is not None else []
+        self.constraints = constraints
+
+    @classmethod
+    def collected(
+        cls, failures: List["SchemaValidationError"]
+    ) -> "SchemaValidationError":
+        return cls(f"{len(failures)} validation error(s)", "multiple", errors=failures)
+
+    @property
+    def pointer(self) -> str:
+        return "".join(
+            "/" + str(part).replace("~", "~0").replace("/", "~1") for part in self.path
+        )
+
+    def at(self, *path: Union[str, int]) -> "SchemaValidationError":
+        self.path = path + self.path
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.errors:
+            return {"code": self.code, "errors": [e.to_dict() for e in self.errors]}
+        return dict(self.constraints, path=self.pointer, code=self.code)
+
+
+class WrongType(SchemaValidationError):
+    code = "wrong_type"
+
+
+class OutOfRange(SchemaValidationError):
+    code = "out_of_range"
+
+
+class NotNullable(SchemaValidationError):
+    code = "not_nullable"
+
+
+class NoMatch(SchemaValidationError):
+    code = "no_match"
+
+
+class UnknownField(SchemaValidationError):
+    code = "unknown_field"
+
+
+class InvalidChoice(SchemaValidationError):
+    code = "invalid_choice"
+
+
+class InvalidFormat(SchemaValidationError):
+    code = "invalid_format"
+
+
+class TooLarge(SchemaValidationError):
+    code = "too_large"
@@ -0,0 +1,114 @@
+import bisect
+import threading
+import collections
+from typing import Dict, List, Tuple, Union
+
+from . import errors
+
+BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+
+
+def _label(value: Union[str, None]) -> str:
+    text = "" if value is None else str(value)
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Registry:
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.calls: Dict[Tuple[str, Union[str, None]], int] = collections.Counter()
+        self.failures: Dict[Tuple[str, Union[str, None], str], int] = (
+            collections.Counter()
+        )
+        self.latency: Dict[Tuple[str, Union[str, None]], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        schema: str,
+        field: Union[str, None],
+        seconds: float,
+        error: Union[errors.SchemaValidationError, None],
+    ):
+        key = (schema, field)
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.calls[key] += 1
+            if error is not None:
+                self.failures[(schema, field, error.code)] += 1
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = [0] * (len(self.buckets) + 2)
+            histogram[index] += 1
+            histogram[-1] += seconds
+
+    def clear(self):
+        with self._lock:
+            self.calls.clear()
+            self.failures.clear()
+            self.latency.clear()
+
+    def to_prometheus(self, prefix: str = "flask_schema") -> str:
+        with self._lock:
+            calls = sorted(self.calls.items(), key=str)
+            failures = sorted(self.failures.items(), key=str)
+            latency = sorted(
+                ((key, list(histogram)) for key, histogram in self.latency.items()),
+                key=str,
+            )
+        lines = [
+            f"# HELP {prefix}_validations_total Validation calls.",
+            f"# TYPE {prefix}_validations_total counter",
+        ]
+        for (schema, field), count in calls:
+            labels = f'schema="{_label(schema)}",field="{_label(field)}"'
+            lines.append(f"{prefix}_validations_total{{{labels}}} {count}")
+        lines.extend(
+            [
+                f"# HELP {prefix}_failures_total Validation failures by error code.",
+                f"# TYPE {prefix}_failures_total counter",
+            ]
+        )
+        for (schema, field, code), count in failures:
+            labels = (
+                f'schema="{_label(schema)}",field="{_label(field)}",'
+                f'code="{_label(code)}"'
+            )
+            lines.append(f"{prefix}_failures_total{{{labels}}} {count}")
+        lines.extend(
+            [
+                f"# HELP {prefix}_validation_seconds Validation latency.",
+                f"# TYPE {prefix}_validation_seconds histogram",
+            ]
+        )
+        for (schema, field), histogram in latency:
+            labels = f'schema="{_label(schema)}",field="{_label(field)}"'
+            total = 0
+            for bound, count in zip(self.buckets + (float("inf"),), histogram):
+                total += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    f'{prefix}_validation_seconds_bucket{{{labels},le="{le}"}} {total}'
+                )
+            lines.append(f"{prefix}_validation_seconds_sum{{{labels}}} {histogram[-1]}")
+            lines.append(f"{prefix}_validation_seconds_count{{{labels}}} {total}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
@@ -0,0 +1,105 @@
+import urllib.parse
+from typing import Any, Callable, Dict, List, Mapping, Type, Union
+
+from . import types, errors
+
+
+def converter(prop: Any) -> Union[Callable[[str], Any], None]:
+    if isinstance(prop, types.Schema):
+        prop = prop._root
+    return types.converter(getattr(prop, "types", None))
+
+
+def _object(schema: Union[Type[types.Schema], types.Schema, types.Object]) -> Any:
+    if isinstance(schema, type) and issubclass(schema, types.Schema):
+        return schema._get_object()
+    if isinstance(schema, types.Schema):
+        return schema._root
+    if isinstance(schema, types.Object):
+        return schema
+    raise TypeError(f"expected a Schema or Object, got {schema!r}")
+
+
+class _Field:
+    __slots__ = ("name", "key", "label", "many", "convert")
+
+    def __init__(self, name: str, key: str, label: str, prop: Any):
+        self.name = name
+        self.key = key
+        self.label = label
+        self.many = isinstance(prop, types.Array)
+        self.convert = converter(prop.schema if self.many else prop)
+
+    def value(self, raw: Union[str, List[str], None]) -> Any:
+        if raw is None or self.convert is None:
+            return raw
+        try:
+            if self.many:
+                return [self.convert(item) for item in raw]
+            return self.convert(raw)
+        except (ValueError, KeyError):
+            raise errors.WrongType(f"cannot convert {raw!r}").at(self.label)
+
+
+class Params:
+    def __init__(
+        self,
+        schema: Union[Type[types.Schema], types.Schema, types.Object],
+        validate: Callable[[Dict], Dict] = None,
+    ):
+        self.object = _object(schema)
+        self.validate = validate or self.object
+        self.fields = [
+            self._field(name, prop) for name, prop in self.object.schema.items()
+        ]
+
+    def _field(self, name: str, prop: Any) -> _Field:
+        return _Field(name, name, name, prop)
+
+    def _validated(self, raw: Mapping[str, Any]) -> Dict:
+        return self.validate(
+            {field.name: field.value(raw.get(field.key)) for field in self.fields}
+        )
+
+
+class QueryParams(Params):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super(QueryParams, self).__init__(*args, **kwargs)
+        self.keys = {field.key: field for field in self.fields}
+
+    def __call__(self, query_string: bytes) -> Dict:
+        raw: Dict[str, Any] = {}
+        for pair in query_string.decode("utf-8", "replace").split("&"):
+            if not pair:
+                continue
+            key, _, value = pair.partition("=")
+            key = urllib.parse.unquote_plus(key)
+            field = self.keys.get(key)
+            if field is None:
+                if self.object.strict:
+                    raise errors.UnknownField(fields=[key])
+                continue
+            value = urllib.parse.unquote_plus(value)
+            if not field.many:
+                raw.setdefault(key, value)
+            else:
+                raw.setdefault(key, []).append(value)
+        return self._validated(raw)
+
+
+class HeaderParams(Params):
+    special = {"CONTENT_TYPE", "CONTENT_LENGTH"}
+
+    def _field(self, name: str, prop: Any) -> _Field:
+        key = name.upper()
+        key = key if key in self.special else f"HTTP_{key}"
+        return _Field(name, key, name.replace("_", "-"), prop)
+
+    def __call__(self, environ: Mapping[str, str]) -> Dict:
+        raw: Dict[str, Any] = {}
+        for field in self.fields:
+            value = environ.get(field.key)
+            if value is not None and field.many:
+                value = [item.strip() for item in value.split(",")]
+            raw[field.key] = value
+        return self._validated(raw)
@@ -0,0 +1,240 @@
+import re
+import json
+import codecs
+from typing import IO, Any, Callable, Dict, Pattern, Union
+
+from . import types, errors
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_CHARS = re.compile(r'[^"\\\x00-\x1f]*')
+_NUMBER_CHARS = re.compile(r"[-+.eE0-9]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class _Reader:
+    def __init__(
+        self, stream: IO[bytes], max_size: int = None, chunk_size: int = 65536
+    ):
+        self.stream = stream
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0
+        self.size = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        self.size += len(chunk)
+        if self.max_size is not None and self.size > self.max_size:
+            raise errors.TooLarge(maximum=self.max_size)
+        try:
+            text = self.decoder.decode(chunk, final=not chunk)
+        except UnicodeDecodeError as ex:
+            raise errors.InvalidFormat(f"malformed JSON: {ex.reason}")
+        self.eof = not chunk
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return True
+
+    def _ensure(self, length: int):
+        while len(self.buffer) - self.pos < length and self._fill():
+            pass
+
+    def _scan(self, chars: Pattern) -> str:
+        parts = []
+        while True:
+            end = chars.match(self.buffer, self.pos).end()
+            parts.append(self.buffer[self.pos : end])
+            self.pos = end
+            if end < len(self.buffer) or not self._fill():
+                return "".join(parts)
+
+    def error(self, reason: str) -> errors.SchemaValidationError:
+        return errors.InvalidFormat(
+            f"malformed JSON: {reason}", position=self.offset + self.pos
+        )
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise self.error(f"expected {char!r}")
+        self.pos += 1
+
+    def next_item(self, end: str) -> bool:
+        char = self.peek()
+        self.pos += 1
+        if char == ",":
+            return True
+        if char == end:
+            return False
+        raise self.error(f"expected ',' or {end!r}")
+
+    def start(self, begin: str, end: str) -> bool:
+        self.expect(begin)
+        if self.peek() == end:
+            self.pos += 1
+            return False
+        return True
+
+    def read_string(self) -> str:
+        if self.peek() != '"':
+            raise self.error("expected string")
+        self.pos += 1
+        parts = [self._scan(_STRING_CHARS)]
+        while self.buffer[self.pos : self.pos + 1] == "\\":
+            self._ensure(2)
+            parts.append(self.buffer[self.pos : self.pos + 2])
+            self.pos += 2
+            parts.append(self._scan(_STRING_CHARS))
+        char = self.buffer[self.pos : self.pos + 1]
+        if char != '"':
+            raise self.error("unterminated string" if not char else "invalid character")
+        self.pos += 1
+        if len(parts) == 1:
+            return parts[0]
+        try:
+            return json.loads('"' + "".join(parts) + '"')
+        except ValueError:
+            raise self.error("invalid string escape")
+
+    def read_key(self) -> str:
+        key = self.read_string()
+        self.expect(":")
+        return key
+
+    def read_scalar(self) -> Union[str, int, float, bool, None]:
+        char = self.peek()
+        if char == '"':
+            return self.read_string()
+        if char == "-" or char.isdigit():
+            match = _NUMBER.fullmatch(self._scan(_NUMBER_CHARS))
+            if match is None:
+                raise self.error("invalid number")
+            if match.group(1) is None and match.group(2) is None:
+                return int(match.group(0))
+            return float(match.group(0))
+        self._ensure(5)
+        for literal, value in _LITERALS.items():
+            if self.buffer.startswith(literal, self.pos):
+                self.pos += len(literal)
+                return value
+        raise self.error("unexpected character")
+
+    def read_value(self) -> Any:
+        char = self.peek()
+        if char == "{":
+            obj = {}
+            more = self.start("{", "}")
+            while more:
+                key = self.read_key()
+                obj[key] = self.read_value()
+                more = self.next_item("}")
+            return obj
+        if char == "[":
+            array = []
+            more = self.start("[", "]")
+            while more:
+                array.append(self.read_value())
+                more = self.next_item("]")
+            return array
+        return self.read_scalar()
+
+    def skip_value(self):
+        char = self.peek()
+        if char == "{":
+            more = self.start("{", "}")
+            while more:
+                self.read_key()
+                self.skip_value()
+                more = self.next_item("}")
+        elif char == "[":
+            more = self.start("[", "]")
+            while more:
+                self.skip_value()
+                more = self.next_item("]")
+        else:
+            self.read_scalar()
+
+
+def _streams(prop: Any, kind: type) -> bool:
+    return (
+        isinstance(prop, kind)
+        and prop.callback is None
+        and not getattr(prop, "collect_errors", False)
+        and not getattr(prop, "lazy", False)
+        and getattr(prop, "metrics", None) is None
+    )
+
+
+def _read_object(reader: _Reader, obj: types.Object) -> Dict:
+    values = {}
+    more = reader.start("{", "}")
+    while more:
+        key = reader.read_key()
+        field = obj.schema.get(key)
+        if field is not None:
+            values[key] = _read(reader, field)
+        elif obj.strict:
+            raise errors.UnknownField(fields=[key])
+        else:
+            reader.skip_value()
+        more = reader.next_item("}")
+    return {
+        key: values[key] if key in values else field(None)
+        for key, field in obj.schema.items()
+    }
+
+
+def _read_array(reader: _Reader, array: types.Array) -> Any:
+    items = []
+    maximum = array.range.bounds()[1]
+    more = reader.start("[", "]")
+    while more:
+        items.append(_read(reader, array.schema))
+        if maximum is not None and len(items) > maximum:
+            raise array.range.error()
+        more = reader.next_item("]")
+    if not array.range.check(items):
+        raise array.range.error()
+    return items if array.as_array is None else array._to_array(items)
+
+
+def _read(reader: _Reader, prop: Callable) -> Any:
+    if isinstance(prop, types.Schema):
+        prop = prop._root
+    char = reader.peek()
+    if char == "{" and _streams(prop, types.Object):
+        return _read_object(reader, prop)
+    if char == "[" and _streams(prop, types.Array):
+        return _read_array(reader, prop)
+    return prop(reader.read_value())
+
+
+@types._scoped
+def validate(
+    stream: IO[bytes],
+    rule: Union[types.Schema, types.Property],
+    max_size: int = None,
+    chunk_size: int = 65536,
+) -> Any:
+    reader = _Reader(stream, max_size, chunk_size)
+    if reader.peek() == "":
+        return rule(None)
+    value = _read(reader, rule)
+    if reader.peek() != "":
+        raise reader.error("unexpected trailing data")
+    return value
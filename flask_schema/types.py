@@ -1,23 +1,161 @@
 import re
-import copy
+import math
+import time
+import array
+import functools
+import itertools
+import threading
+import concurrent.futures
 import datetime
-from typing import Any, Callable, Dict, List, Pattern, Tuple, Type, Union
+import collections.abc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
 
 from . import errors
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+_date_fromisoformat = getattr(datetime.date, "fromisoformat", None)
+_datetime_fromisoformat = getattr(datetime.datetime, "fromisoformat", None)
+
+_TYPECODES = {
+    "float64": "d",
+    "float32": "f",
+    "int64": "q",
+    "int32": "i",
+    "int16": "h",
+    "int8": "b",
+}
+_INT_BOUNDS = {
+    name: (-(1 << (bits - 1)), (1 << (bits - 1)) - 1)
+    for name, bits in (("int64", 64), ("int32", 32), ("int16", 16), ("int8", 8))
+}
+
+
+_BOOLEANS = {"true": True, "1": True, "false": False, "0": False}
+_DIGITS = re.compile(r"[0-9]+").fullmatch
+_NUMERIC = re.compile(r"[-+]?[0-9]+(\.[0-9]+)?([eE][-+]?[0-9]+)?").fullmatch
+
+
+def _numeric(value: str) -> Match:
+    match = _NUMERIC(value)
+    if match is None:
+        raise ValueError(f"not a number: {value!r}")
+    return match
+
+
+def _to_int(value: str) -> int:
+    match = _numeric(value)
+    if match.group(1) is not None or match.group(2) is not None:
+        raise ValueError(f"not an integer: {value!r}")
+    return int(value)
+
+
+def _to_float(value: str) -> float:
+    _numeric(value)
+    number = float(value)
+    if math.isinf(number):
+        raise ValueError(f"out of range: {value!r}")
+    return number
+
+
+def _to_number(value: str) -> Union[int, float]:
+    match = _numeric(value)
+    if match.group(1) is None and match.group(2) is None:
+        return int(value)
+    return _to_float(value)
+
+
+def _to_bool(value: str) -> bool:
+    return _BOOLEANS[value.lower()]
+
+
+_CONVERTERS: Dict[Tuple[type, ...], Callable[[str], Any]] = {
+    (int,): _to_int,
+    (float,): _to_float,
+    (int, float): _to_number,
+    (bool,): _to_bool,
+}
+
+
+def converter(types: Tuple[type, ...]) -> Union[Callable[[str], Any], None]:
+    return _CONVERTERS.get(types)
+
+
+class _Scope(threading.local):
+    bounds: Union[Dict["_Range", Tuple[Any, Any]], None] = None
+
+
+_scope = _Scope()
+
+
+def _scoped(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def _call(*args: Any, **kwargs: Any) -> Any:
+        if _scope.bounds is not None:
+            return func(*args, **kwargs)
+        _scope.bounds = {}
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _scope.bounds = None
+
+    return _call
+
 
 class _Range:
+    __slots__ = ("min", "max", "length", "dynamic", "compare", "check")
+
     def __init__(
         self,
-        minimum: Union[
-            List, Tuple, str, int, float, datetime.datetime, datetime.date, None
-        ],
-        maximum: Union[
-            List, Tuple, str, int, float, datetime.datetime, datetime.date, None
-        ],
+        minimum: Union[int, float, datetime.datetime, datetime.date, Callable, None],
+        maximum: Union[int, float, datetime.datetime, datetime.date, Callable, None],
+        length: bool = False,
     ):
         self.min = minimum
         self.max = maximum
+        self.length = length
+        self.dynamic = callable(minimum) or callable(maximum)
+        self.compare = self._comparator()
+        if length:
+            compare = self.compare
+            self.check = lambda value: value is None or compare(len(value))
+        else:
+            self.check = self.compare
+
+    def _comparator(self) -> Callable[[Any], bool]:
+        minimum, maximum = self.min, self.max
+        if self.dynamic:
+            bounds = self.bounds
+
+            def _dynamic(value: Any) -> bool:
+                if value is None:
+                    return True
+                low, high = bounds()
+                return (low is None or low <= value) and (high is None or value <= high)
+
+            return _dynamic
+        if minimum is None and maximum is None:
+            return lambda value: True
+        if minimum is None:
+            return lambda value: value is None or value <= maximum
+        if maximum is None:
+            return lambda value: value is None or value >= minimum
+        return lambda value: value is None or minimum <= value <= maximum
 
     def __call__(
         self,
@@ -25,64 +163,190 @@ class _Range:
             List, Tuple, str, int, float, datetime.datetime, datetime.date, None
         ],
     ) -> bool:
+        return self.check(value)
 
-        if value is None:
-            return True
-        if isinstance(value, (list, tuple, str)):
-            value = len(value)
-
-        minimum = self.min() if callable(self.min) else self.min
-        maximum = self.max() if callable(self.max) else self.max
+    def _resolve(self) -> Tuple[Any, Any]:
+        return (
+            self.min() if callable(self.min) else self.min,
+            self.max() if callable(self.max) else self.max,
+        )
 
-        if minimum is None and maximum is None:
-            return True
-        if minimum is None:
-            return value <= maximum
-        if maximum is None:
-            return value >= minimum
-        return minimum <= value <= maximum
+    def bounds(self) -> Tuple[Any, Any]:
+        if not self.dynamic:
+            return self.min, self.max
+        scoped = _scope.bounds
+        if scoped is None:
+            return self._resolve()
+        resolved = scoped.get(self)
+        if resolved is None:
+            resolved = scoped[self] = self._resolve()
+        return resolved
+
+    def error(self) -> errors.SchemaValidationError:
+        minimum, maximum = self.bounds()
+        return errors.OutOfRange(minimum=minimum, maximum=maximum)
+
+
+def _collect(func: Callable, value: Any, path: Tuple, failures: List[Any]) -> Any:
+    if isinstance(func, Schema):
+        func = func._root
+    if isinstance(func, Property):
+        return func._collect(value, path, failures)
+    try:
+        return func(value)
+    except errors.SchemaValidationError as ex:
+        failures.extend(error.at(*path) for error in ex.errors or [ex])
+        return value
 
 
 class Schema:
+    __slots__ = ("_root",)
+
+    _fields: Dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super(Schema, cls).__init_subclass__(**kwargs)
+        cls._fields = Object._load(cls)
+
     def __init__(self):
-        self.object = Object(
-            self.__class__,
-            strict=self._is_strict,
-            nullable=False,
-            default=None,
-            callback=None,
-        )
+        self._root = self._get_object()
 
     @property
-    def _is_strict(self) -> bool:
-        return getattr(self, "__strict__", False)
+    def object(self) -> "Object":
+        return self._root
+
+    @classmethod
+    def _is_strict(cls) -> bool:
+        return getattr(cls, "__strict__", False)
+
+    @classmethod
+    def _collects_errors(cls) -> bool:
+        return getattr(cls, "__collect_errors__", False)
+
+    @classmethod
+    def _is_lazy(cls) -> bool:
+        return getattr(cls, "__lazy__", False)
+
+    @classmethod
+    def _metrics(cls) -> Union[Callable, None]:
+        return getattr(cls, "__metrics__", None)
+
+    @classmethod
+    def _get_object(cls) -> "Object":
+        obj = cls.__dict__.get("_object")
+        if obj is None:
+            obj = cls._object = Object(
+                cls,
+                strict=cls._is_strict(),
+                collect_errors=cls._collects_errors(),
+                lazy=cls._is_lazy(),
+                metrics=cls._metrics(),
+                nullable=False,
+                default=None,
+                callback=None,
+            )
+        return obj
+
+    @classmethod
+    def _get_compiled(cls) -> Callable[[Dict], Dict]:
+        compiled = cls.__dict__.get("_compiled")
+        if compiled is None:
+            from . import compiler
+
+            compiled = cls._compiled = compiler.compile_property(cls._get_object())
+        return compiled
+
+    @classmethod
+    def compile(cls) -> Callable[[Dict], Dict]:
+        return cls._get_compiled()
+
+    @classmethod
+    def validate(
+        cls, value: Dict
+    ) -> Tuple[bool, Union[Dict, None], Union[errors.SchemaValidationError, None]]:
+        return cls._get_object().validate(value)
+
+    @classmethod
+    def validate_many(
+        cls, values: Iterable[Dict], workers: int = None, chunk_size: int = 1000
+    ) -> Iterator[
+        Tuple[bool, Union[Dict, None], Union[errors.SchemaValidationError, None]]
+    ]:
+        if not workers:
+            validate = cls._get_object().validate
+            return (validate(value) for value in values)
+        if "<locals>" in cls.__qualname__:
+            raise TypeError(f"{cls.__qualname__} must be importable to use workers")
+        if cls._is_lazy():
+            raise TypeError(f"lazy schema {cls.__qualname__} cannot use workers")
+        return cls._validate_pool(iter(values), workers, chunk_size)
+
+    @classmethod
+    def _validate_pool(
+        cls, values: Iterator[Dict], workers: int, chunk_size: int
+    ) -> Iterator[Tuple]:
+        chunks = iter(lambda: list(itertools.islice(values, chunk_size)), [])
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_validate_chunk, cls, chunk))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
 
     def __call__(self, value: Dict) -> Dict:
-        return self.object(value)
+        return self._root(value)
+
+
+def _validate_one(schema: Type[Schema], value: Dict) -> Tuple:
+    return schema._get_object().validate(value)
+
+
+def _validate_chunk(schema: Type[Schema], chunk: List[Dict]) -> List[Tuple]:
+    validate = schema._get_object().validate
+    return [validate(value) for value in chunk]
 
 
 class Property:
+    __slots__ = ("types", "nullable", "default", "callback", "convert")
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super(Property, cls).__init_subclass__(**kwargs)
+        if "__call__" in cls.__dict__ and "_check" not in cls.__dict__:
+            cls._check = Property._guarded
+
     def __init__(
         self,
         *types: Type[Any],
         nullable: bool = True,
         default: Any = None,
         callback: Callable = None,
+        coerce: bool = False,
     ):
         self.types = types
         self.nullable = nullable
         self.default = default
         self.callback = callback
+        self.convert = converter(types) if coerce else None
 
     def _get_value(self, value: Any) -> Any:
         if value is not None:
             return value
         if not self.nullable:
-            raise errors.SchemaValidationError()  # TODO not nullable
+            raise errors.NotNullable()
         if callable(self.default):
             return self.default()
         return self.default
 
+    def _coerce(self, value: Any) -> Any:
+        if self.convert is None or value.__class__ is not str:
+            raise errors.WrongType(expected=[t.__name__ for t in self.types])
+        try:
+            return self.convert(value)
+        except (ValueError, KeyError):
+            raise errors.WrongType(expected=[t.__name__ for t in self.types])
+
     def __call__(self, value: Any) -> Any:
         value = self._get_value(value)
         if (
@@ -90,21 +354,96 @@ class Property:
             and len(self.types) > 0
             and not isinstance(value, self.types)
         ):
-            raise errors.SchemaValidationError()  # TODO wrong type
+            value = self._coerce(value)
         if self.callback is not None:
             return self.callback(value)
         return value
 
+    def _guarded(self, value: Any) -> Tuple[Any, Any]:
+        try:
+            return self(value), None
+        except errors.SchemaValidationError as ex:
+            return None, ex.with_traceback(None)
+
+    def _check(self, value: Any) -> Tuple[Any, Any]:
+        if value is None:
+            if not self.nullable:
+                return None, errors.NotNullable()
+            if callable(self.default):
+                return self._guarded_call(self.default)
+            value = self.default
+        if (
+            value is not None
+            and len(self.types) > 0
+            and not isinstance(value, self.types)
+        ):
+            if self.convert is None or value.__class__ is not str:
+                return None, errors.WrongType(expected=[t.__name__ for t in self.types])
+            try:
+                value = self.convert(value)
+            except (ValueError, KeyError):
+                return None, errors.WrongType(expected=[t.__name__ for t in self.types])
+        if self.callback is not None:
+            return self._guarded_call(self.callback, value)
+        return value, None
+
+    @classmethod
+    def _guarded_call(cls, func: Callable, *args: Any) -> Tuple[Any, Any]:
+        try:
+            return func(*args), None
+        except errors.SchemaValidationError as ex:
+            return None, ex.with_traceback(None)
+
+    def validate(
+        self, value: Any
+    ) -> Tuple[bool, Any, Union[errors.SchemaValidationError, None]]:
+        value, error = self._check(value)
+        return error is None, value, error
+
+    def _collect(self, value: Any, path: Tuple, failures: List[Any]) -> Any:
+        return _collect(self.__call__, value, path, failures)
+
+    def _validate_all(self, value: Any) -> Any:
+        failures = []
+        value = self._collect(value, (), failures)
+        if failures:
+            raise errors.SchemaValidationError.collected(failures)
+        return value
+
 
 class Object(Property):
-    def __init__(self, schema: Type[Schema], strict: bool = False, **kwargs):
+    __slots__ = ("strict", "collect_errors", "lazy", "schema", "name", "metrics")
+
+    def __init__(
+        self,
+        schema: Type[Schema],
+        strict: bool = False,
+        collect_errors: bool = False,
+        lazy: bool = False,
+        metrics: Callable = None,
+        **kwargs,
+    ):
         super(Object, self).__init__(dict, **kwargs)
         self.strict = strict
+        self.collect_errors = collect_errors
+        self.lazy = lazy
         self.schema = self._load(schema)
+        self.name = getattr(schema, "__qualname__", type(schema).__qualname__)
+        self.metrics = metrics
+
+    @classmethod
+    def _is_field(cls, schema: Type[Schema], name: str) -> bool:
+        if name.startswith("_"):
+            return False
+        owner = next((c for c in schema.__mro__ if name in c.__dict__), None)
+        return owner is not Schema
 
     @classmethod
     def _load(cls, schema: Type[Schema]) -> Dict:
-        return {f: getattr(schema, f) for f in dir(schema) if not f.startswith("_")}
+        fields = schema.__dict__.get("_fields")
+        if fields is not None:
+            return fields
+        return {f: getattr(schema, f) for f in dir(schema) if cls._is_field(schema, f)}
 
     def _valid_fields(self, obj: Dict) -> bool:
         return all(key in self.schema for key in obj)
@@ -112,60 +451,316 @@ class Object(Property):
     def _valid_values(self, obj: Dict) -> Dict:
         return {key: func(obj.get(key, None)) for key, func in self.schema.items()}
 
-    def __call__(self, value: Union[Dict, None]) -> Union[Dict, None]:
+    def _observed_values(self, obj: Dict) -> Dict:
+        values = {}
+        for key, func in self.schema.items():
+            start = time.perf_counter()
+            try:
+                values[key] = func(obj.get(key, None))
+            except errors.SchemaValidationError as ex:
+                self.metrics(self.name, key, time.perf_counter() - start, ex)
+                raise
+            self.metrics(self.name, key, time.perf_counter() - start, None)
+        return values
+
+    def _unknown_fields(self, obj: Dict) -> List[str]:
+        return [key for key in obj if key not in self.schema]
+
+    def _collect(
+        self, value: Union[Dict, None], path: Tuple, failures: List[Any]
+    ) -> Union[Dict, None]:
+        value = _collect(super(Object, self).__call__, value, path, failures)
+        if not isinstance(value, dict):
+            return value
+        if self.strict:
+            failures.extend(
+                errors.UnknownField().at(*path, key)
+                for key in self._unknown_fields(value)
+            )
+        return {
+            key: _collect(func, value.get(key, None), path + (key,), failures)
+            for key, func in self.schema.items()
+        }
+
+    def _validate(
+        self, value: Union[Dict, None], values: Callable[[Dict], Dict]
+    ) -> Union[Dict, None]:
+        if self.collect_errors:
+            return self._validate_all(value)
         value = super(Object, self).__call__(value)
         if value is None:
             return None
         if self.strict and not self._valid_fields(value):
-            raise errors.SchemaValidationError()  # TODO invalid fields
-        return self._valid_values(value)
+            raise errors.UnknownField(fields=self._unknown_fields(value))
+        if self.lazy:
+            return LazyObject(self.schema, value)
+        return values(value)
+
+    def _observed(self, value: Union[Dict, None]) -> Union[Dict, None]:
+        start = time.perf_counter()
+        try:
+            value = self._validate(value, self._observed_values)
+        except errors.SchemaValidationError as ex:
+            self.metrics(self.name, None, time.perf_counter() - start, ex)
+            raise
+        self.metrics(self.name, None, time.perf_counter() - start, None)
+        return value
+
+    @_scoped
+    def __call__(self, value: Union[Dict, None]) -> Union[Dict, None]:
+        if self.metrics is not None:
+            return self._observed(value)
+        return self._validate(value, self._valid_values)
+
+
+class LazyObject(collections.abc.Mapping):
+    __slots__ = ("_schema", "_value", "_valid")
+
+    def __init__(self, schema: Dict[str, Callable], value: Dict):
+        self._schema = schema
+        self._value = value
+        self._valid: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._valid[key]
+        except KeyError:
+            func = self._schema[key]
+        valid = self._valid[key] = func(self._value.get(key, None))
+        return valid
+
+    def __iter__(self):
+        return iter(self._schema)
+
+    def __len__(self) -> int:
+        return len(self._schema)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._value!r})"
+
+    def validate_all(self) -> Dict:
+        return {key: self[key] for key in self._schema}
 
 
 class Array(Property):
+    __slots__ = ("schema", "range", "collect_errors", "bulk", "as_array")
+
     def __init__(
         self,
         schema: Union[Property, Type[Property]],
         min_length: Union[int, float, Callable] = None,
         max_length: Union[int, float, Callable] = None,
+        collect_errors: bool = False,
+        as_array: str = None,
         **kwargs,
     ):
         super(Array, self).__init__(list, **kwargs)
         self.schema = schema() if isinstance(schema, type) else schema
-        self.range = _Range(min_length, max_length)
+        self.range = _Range(min_length, max_length, length=True)
+        self.collect_errors = collect_errors
+        self.bulk = type(self.schema) in (Number, Int, Float, Bool, String) and (
+            self.schema.callback is None
+        )
+        self.as_array = as_array
+        if as_array is not None:
+            self._check_as_array(as_array)
+
+    def _check_as_array(self, as_array: str):
+        if as_array not in _TYPECODES:
+            raise ValueError(f"unsupported array type {as_array!r}")
+        item_type = Number if as_array.startswith("float") else Int
+        if not (self.bulk and isinstance(self.schema, item_type)):
+            raise TypeError(f"{as_array!r} arrays need {item_type.__name__} items")
+
+    def _to_array(self, items: List[Any]) -> Any:
+        if any(item is None for item in items):
+            raise errors.WrongType(expected=[self.as_array])
+        bounds = _INT_BOUNDS.get(self.as_array)
+        if bounds is not None and items and (
+            min(items) < bounds[0] or max(items) > bounds[1]
+        ):
+            raise errors.OutOfRange(dtype=self.as_array)
+        try:
+            if numpy is not None:
+                result = numpy.array(items, dtype=self.as_array)
+            else:
+                result = array.array(_TYPECODES[self.as_array], items)
+        except OverflowError:
+            raise errors.OutOfRange(dtype=self.as_array)
+        if self.as_array == "float32" and any(
+            math.isinf(out) and not math.isinf(item) for out, item in zip(result, items)
+        ):
+            raise errors.OutOfRange(dtype=self.as_array)
+        return result
+
+    def _output(self, items: List[Any]) -> Any:
+        if self.as_array is None:
+            return list(items)
+        return self._to_array(items)
+
+    def _bulk_valid(self, value: List[Any]) -> bool:
+        kinds = set(map(type, value))
+        if not all(issubclass(kind, self.schema.types) for kind in kinds):
+            return False
+        item_range = getattr(self.schema, "range", None)
+        if not value or item_range is None:
+            return True
+        minimum, maximum = item_range.bounds()
+        if minimum is None and maximum is None:
+            return True
+        if float in kinds:
+            total = sum(value)
+            if total != total:
+                return False
+        measured = list(map(len, value)) if isinstance(self.schema, String) else value
+        if minimum is not None and min(measured) < minimum:
+            return False
+        return maximum is None or max(measured) <= maximum
+
+    def _check(self, value: Union[List[Any], None]) -> Union[List[Any], None]:
+        value = super(Array, self).__call__(value)
+        if not self.range.check(value):
+            raise self.range.error()
+        return value
 
+    def _collect(
+        self, value: Union[List[Any], None], path: Tuple, failures: List[Any]
+    ) -> Union[List[Any], None]:
+        value = _collect(self._check, value, path, failures)
+        if not isinstance(value, list):
+            return value
+        if self.bulk and self._bulk_valid(value):
+            return _collect(self._output, value, path, failures)
+        count = len(failures)
+        items = [
+            _collect(self.schema, item, path + (i,), failures)
+            for i, item in enumerate(value)
+        ]
+        if len(failures) > count:
+            return items
+        return _collect(self._output, items, path, failures)
+
+    @_scoped
     def __call__(self, value: Union[List[Any], None]) -> Union[List[Any], None]:
-        value = super(Array, self).__call__(value)
-        if not self.range(value):
-            raise errors.SchemaValidationError()  # TODO out of range
+        if self.collect_errors:
+            return self._validate_all(value)
+        value = self._check(value)
         if value is None:
             return None
-        for i in range(len(value)):
-            value[i] = self.schema(value[i])
-        return value
+        if self.bulk and self._bulk_valid(value):
+            return self._output(value)
+        items = [self.schema(item) for item in value]
+        return items if self.as_array is None else self._to_array(items)
 
 
 class Choice(Property):
-    def __init__(self, choices, **kwargs):
+    __slots__ = (
+        "choices",
+        "discriminator",
+        "tags",
+        "literals",
+        "unhashable",
+        "alternatives",
+    )
+
+    def __init__(
+        self,
+        choices: Union[List[Any], Dict[Any, Union[Type[Schema], Schema, Property]]],
+        discriminator: str = None,
+        **kwargs,
+    ):
         super(Choice, self).__init__(**kwargs)
         self.choices = choices
+        self.discriminator = discriminator
+        self.tags = None if discriminator is None else self._load_tags(choices)
+        self.literals: Dict[Any, int] = {}
+        self.unhashable: List[Tuple[int, Any]] = []
+        self.alternatives: List[Tuple[int, Property]] = []
+        if self.tags is None:
+            self._load_choices(choices)
+
+    def _load_choices(self, choices: List[Any]):
+        for position, choice in enumerate(choices):
+            if isinstance(choice, Property):
+                self.alternatives.append((position, choice))
+                continue
+            try:
+                self.literals.setdefault(choice, position)
+            except TypeError:
+                self.unhashable.append((position, choice))
+
+    def _literal_position(self, value: Any) -> Union[int, None]:
+        try:
+            position = self.literals.get(value)
+        except TypeError:
+            position = None
+        for candidate, literal in self.unhashable:
+            if position is not None and candidate > position:
+                break
+            if value == literal:
+                return candidate
+        return position
 
+    @classmethod
+    def _branch(cls, choice: Union[Type[Schema], Schema, Property]) -> Callable:
+        return choice() if isinstance(choice, type) else choice
+
+    def _branch_tags(self, branch: Callable) -> List[Any]:
+        if isinstance(branch, Schema):
+            branch = branch._root
+        fields = branch.schema if isinstance(branch, Object) else {}
+        tag = fields.get(self.discriminator)
+        if not isinstance(tag, Choice) or tag.discriminator is not None:
+            raise TypeError(
+                f"{self.discriminator!r} must be a Choice of literal tag values"
+            )
+        return [value for value in tag.choices if not isinstance(value, Property)]
+
+    def _load_tags(self, choices: Union[List, Dict]) -> Dict[Any, Callable]:
+        if isinstance(choices, dict):
+            return {tag: self._branch(choice) for tag, choice in choices.items()}
+        tags = {}
+        for choice in choices:
+            branch = self._branch(choice)
+            for tag in self._branch_tags(branch):
+                tags.setdefault(tag, branch)
+        return tags
+
+    def _dispatch(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            raise errors.WrongType(expected=["dict"])
+        tag = value.get(self.discriminator)
+        try:
+            branch = self.tags.get(tag)
+        except TypeError:
+            branch = None
+        if branch is None:
+            raise errors.InvalidChoice(allowed=list(self.tags)).at(self.discriminator)
+        return branch(value)
+
+    @_scoped
     def __call__(self, value: Any) -> Any:
         value = super(Choice, self).__call__(value)
         if value is None:
             return None
-        for choice in self.choices:
-            if isinstance(choice, Property):
-                try:
-                    return choice(copy.deepcopy(value))
-                except errors.SchemaValidationError:
-                    continue
-            elif value == choice:
-                return value
-
-        raise errors.SchemaValidationError()
+        if self.tags is not None:
+            return self._dispatch(value)
+        position = self._literal_position(value)
+        for candidate, choice in self.alternatives:
+            if position is not None and candidate > position:
+                break
+            try:
+                return choice(value)
+            except errors.SchemaValidationError:
+                continue
+        if position is not None:
+            return value
+        raise errors.InvalidChoice()
 
 
 class Number(Property):
+    __slots__ = ("range",)
+
     def __init__(
         self,
         types: Tuple = (int, float),
@@ -178,30 +773,46 @@ class Number(Property):
 
     def __call__(self, value: Union[int, float, None]) -> Union[int, float, None]:
         value = super(Number, self).__call__(value)
-        if not self.range(value):
-            raise errors.SchemaValidationError()  # TODO out of range
+        if not self.range.check(value):
+            raise self.range.error()
         return value
 
+    def _check(self, value: Any) -> Tuple[Any, Any]:
+        value, error = super(Number, self)._check(value)
+        if error is None and not self.range.check(value):
+            return None, self.range.error()
+        return value, error
+
 
 class Int(Number):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super(Int, self).__init__((int,), **kwargs)
 
 
 class Float(Number):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super(Float, self).__init__((int, float), **kwargs)
 
 
 class Bool(Property):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super(Bool, self).__init__(bool, **kwargs)
 
     def __call__(self, value: Union[bool, None]) -> bool:
         return super(Bool, self).__call__(value)
 
+    _check = Property._check
+
 
 class String(Property):
+    __slots__ = ("range",)
+
     def __init__(
         self,
         min_length: Union[int, float, Callable] = None,
@@ -209,45 +820,96 @@ class String(Property):
         **kwargs,
     ):
         super(String, self).__init__(str, **kwargs)
-        self.range = _Range(min_length, max_length)
+        self.range = _Range(min_length, max_length, length=True)
 
     def __call__(self, value: Union[str, None]) -> Union[str, None]:
         value = super(String, self).__call__(value)
-        if not self.range(value):
-            raise errors.SchemaValidationError()  # TODO out of range
+        if not self.range.check(value):
+            raise self.range.error()
         return value
 
+    def _check(self, value: Any) -> Tuple[Any, Any]:
+        value, error = super(String, self)._check(value)
+        if error is None and not self.range.check(value):
+            return None, self.range.error()
+        return value, error
+
 
 class Regex(String):
-    def __init__(self, matcher: Union[Pattern, str], **kwargs):
+    __slots__ = ("matcher", "match", "accepts")
+
+    def __init__(
+        self,
+        matcher: Union[Pattern, str],
+        fullmatch: bool = False,
+        required: str = None,
+        match_length: Tuple[int, Union[int, None]] = None,
+        **kwargs,
+    ):
         super(Regex, self).__init__(**kwargs)
         self.matcher = re.compile(matcher) if isinstance(matcher, str) else matcher
-
-    def _match(self, value: str):
-        return re.match(self.matcher, value) is not None
+        self.match = self.matcher.fullmatch if fullmatch else self.matcher.match
+        self.accepts = self._prefiltered(required, match_length)
+
+    def _prefiltered(
+        self, required: Union[str, None], match_length: Union[Tuple, None]
+    ) -> Callable[[str], bool]:
+        match = self.match
+        required = frozenset(required or "")
+        minimum, maximum = match_length or (None, None)
+        if not required and minimum is None and maximum is None:
+            return lambda value: match(value) is not None
+
+        def _accepts(value: str) -> bool:
+            if minimum is not None and len(value) < minimum:
+                return False
+            if maximum is not None and len(value) > maximum:
+                return False
+            if required and not required.issubset(value):
+                return False
+            return match(value) is not None
+
+        return _accepts
 
     def __call__(self, value: Union[str, None]) -> Union[str, None]:
         value = super(Regex, self).__call__(value)
-        if value is not None and not self._match(value):
-            raise errors.SchemaValidationError()  # TODO no match
+        if value is not None and not self.accepts(value):
+            raise errors.NoMatch(pattern=self.matcher.pattern)
         return value
 
 
 class Email(Regex):
-    matcher = re.compile(".+@[^@]+.[^@]{2,}$")
+    __slots__ = ()
+
+    pattern = re.compile(".+@[^@]+.[^@]{2,}$")
 
     def __init__(self, **kwargs):
-        super(Email, self).__init__(self.matcher, **kwargs)
+        super(Email, self).__init__(
+            self.pattern, required="@", match_length=(6, None), **kwargs
+        )
 
 
 class Uuid(Regex):
-    matcher = re.compile(
+    __slots__ = ("strip_hyphens",)
+
+    pattern = re.compile(
         "^[a-fA-F0-9]{8}-?[a-fA-F0-9]{4}-?[a-fA-F0-9]{4}-?[a-fA-F0-9]{4}-?[a-fA-F0-9]{12}$"
     )
 
     def __init__(self, strip_hyphens=False, **kwargs):
-        super(Uuid, self).__init__(self.matcher, **kwargs)
+        super(Uuid, self).__init__(self.pattern, **kwargs)
         self.strip_hyphens = strip_hyphens
+        self.accepts = self._accepts_uuid
+
+    def _accepts_uuid(self, value: str) -> bool:
+        if len(value) == 36 and value[8] == value[13] == value[18] == value[23] == "-":
+            value = value.replace("-", "")
+        elif len(value) != 32:
+            return 32 < len(value) < 38 and self.match(value) is not None
+        try:
+            return len(bytes.fromhex(value)) == 16
+        except ValueError:
+            return False
 
     def __call__(self, value: Union[str, None]) -> Union[str, None]:
         value = super(Uuid, self).__call__(value)
@@ -257,6 +919,7 @@ class Uuid(Regex):
 
 
 class Date(Property):
+    __slots__ = ("range",)
 
     date_format = "%Y-%m-%d"
 
@@ -269,11 +932,26 @@ class Date(Property):
         super(Date, self).__init__(datetime.date, **kwargs)
         self.range = _Range(min_value, max_value)
 
+    @classmethod
+    def _parse_iso(cls, value: str) -> Union[datetime.date, None]:
+        if _date_fromisoformat is None or len(value) != 10:
+            return None
+        if value[4] != "-" or value[7] != "-":
+            return None
+        try:
+            return _date_fromisoformat(value)
+        except ValueError:
+            return None
+
+    @classmethod
+    def _parse_strptime(cls, value: str) -> datetime.date:
+        return datetime.datetime.strptime(value, cls.date_format).date()
+
     @classmethod
     def _parse_date(cls, value: str):
         if "T" in value:
             value = value.split("T")[0]
-        return datetime.datetime.strptime(value, cls.date_format).date()
+        return cls._parse_iso(value) or cls._parse_strptime(value)
 
     @classmethod
     def _get_date(
@@ -290,24 +968,26 @@ class Date(Property):
                 return value.date()
             if isinstance(value, datetime.date):
                 return value
-            raise ValueError()  # TODO wrong type
         except ValueError as ex:
-            raise errors.SchemaValidationError(str(ex))  # TODO
+            raise errors.InvalidFormat(str(ex))
+        raise errors.WrongType(expected=["str", "int", "float", "date"])
 
     def __call__(
         self, value: Union[str, float, int, datetime.date, datetime.datetime, None]
     ) -> Union[str, datetime.date, None]:
         value = self._get_date(value)
         value = super(Date, self).__call__(value)
-        if not self.range(value):
-            raise errors.SchemaValidationError()  # TODO out of range
+        if not self.range.check(value):
+            raise self.range.error()
         return value
 
 
 class DateTime(Property):
+    __slots__ = ("range",)
 
     timezone_matcher = re.compile(r"^.*?[+|\-][0-9]{2}:[0-9]{2}$")
     datetime_format = "%Y-%m-%dT%H:%M:%S.%f"
+    timezones: Dict[str, datetime.timezone] = {}
 
     def __init__(
         self,
@@ -318,8 +998,56 @@ class DateTime(Property):
         super(DateTime, self).__init__(datetime.datetime, **kwargs)
         self.range = _Range(min_value, max_value)
 
+    @classmethod
+    def _timezone(cls, offset: str) -> Union[datetime.timezone, None]:
+        timezone = cls.timezones.get(offset)
+        if timezone is not None:
+            return timezone
+        digits = offset[1:3] + offset[4:6]
+        if offset[3] != ":" or _DIGITS(digits) is None:
+            return None
+        delta = datetime.timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        if delta >= datetime.timedelta(hours=24):
+            return None
+        if offset[0] == "-":
+            delta = -delta
+        timezone = datetime.timezone.utc if not delta else datetime.timezone(delta)
+        cls.timezones[offset] = timezone
+        return timezone
+
+    @classmethod
+    def _parse_iso(cls, value: str) -> Union[datetime.datetime, None]:
+        if _datetime_fromisoformat is None:
+            return None
+        if value[-1:] == "Z":
+            value, timezone = value[:-1], datetime.timezone.utc
+        elif value[-6:-5] in ("+", "-") and len(value) > 6:
+            value, timezone = value[:-6], cls._timezone(value[-6:])
+        else:
+            timezone = datetime.timezone.utc
+        if timezone is None:
+            return None
+        if not 21 <= len(value) <= 26 or value[11:13] == "24":
+            return None
+        if value[4:20:3] != "--T::.":
+            return None
+        fraction = value[20:]
+        digits = value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16]
+        digits += value[17:19] + fraction
+        if _DIGITS(digits) is None:
+            return None
+        try:
+            parsed = _datetime_fromisoformat(value[:19])
+        except ValueError:
+            return None
+        return parsed.replace(microsecond=int(fraction.ljust(6, "0")), tzinfo=timezone)
+
     @classmethod
     def _parse_datetime(cls, value: str):
+        return cls._parse_iso(value) or cls._parse_strptime(value)
+
+    @classmethod
+    def _parse_strptime(cls, value: str):
 
         if value.endswith("Z"):
             value = f"{value[:-1]}+00:00"
@@ -361,15 +1089,15 @@ class DateTime(Property):
                 return cls._parse_datetime(value)
             if isinstance(value, datetime.datetime):
                 return value
-            raise ValueError()  # TODO wrong type
         except ValueError as ex:
-            raise errors.SchemaValidationError(str(ex))  # TODO
+            raise errors.InvalidFormat(str(ex))
+        raise errors.WrongType(expected=["str", "int", "float", "datetime"])
 
     def __call__(
         self, value: Union[str, float, int, datetime.datetime, None]
     ) -> Union[str, datetime.datetime, None]:
         value = self._get_datetime(value)
         value = super(DateTime, self).__call__(value)
-        if not self.range(value):
-            raise errors.SchemaValidationError()  # TODO out of range
+        if not self.range.check(value):
+            raise self.range.error()
         return value
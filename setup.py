@@ -8,11 +8,18 @@ VERSION = '0.0.0'
 REQUIRES = [
     "flask"
 ]
+EXTRAS = {
+    "numpy": ["numpy"],
+    "orjson": ["orjson"],
+    "msgspec": ["msgspec"],
+    "ujson": ["ujson"]
+}
 
 
 setuptools.setup(
     name=NAME,
     version=VERSION,
     install_requires=REQUIRES,
-    packages=setuptools.find_packages()
+    extras_require=EXTRAS,
+    packages=setuptools.find_packages(exclude=["benchmarks", "benchmarks.*"])
 )
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import unittest
+import unittest.mock
+import concurrent.futures
+import flask
+import flask_schema.types
+import flask_schema.errors
+import flask_schema.decorators
+
+
+class Point(flask_schema.types.Schema):
+    x = flask_schema.types.Int(nullable=False)
+    y = flask_schema.types.Int()
+
+
+async def route(json_body, *args):
+    return json_body, args
+
+
+class AsyncSchemaProtectTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask("TestFlask")
+
+    def call(self, protect, body, *args):
+        with self.app.test_request_context(method="POST", json=body):
+            return asyncio.run(protect(route)(*args))
+
+    def test_coroutine_wrapper(self):
+        func = flask_schema.decorators.SchemaProtect(Point)(route)
+        self.assertTrue(asyncio.iscoroutinefunction(func))
+        self.assertEqual(func.__name__, "route")
+
+    def test_validates_inline(self):
+        protect = flask_schema.decorators.SchemaProtect(Point)
+        self.assertEqual(
+            self.call(protect, {"x": 1}, "arg"), ({"x": 1, "y": None}, ("arg",))
+        )
+
+    def test_fails_inline(self):
+        protect = flask_schema.decorators.SchemaProtect(Point)
+        self.assertRaises(flask_schema.errors.NotNullable, self.call, protect, {"y": 1})
+
+    def test_offloads_large_bodies(self):
+        threads = []
+        rule = flask_schema.types.Object(
+            Point, callback=lambda v: threads.append(threading.get_ident()) or v
+        )
+        protect = flask_schema.decorators.SchemaProtect(rule, offload_size=10)
+        self.call(protect, {"x": 1})
+        self.call(protect, {"x": 1, "y": 2222222})
+        self.assertEqual(threads[0], threading.get_ident())
+        self.assertNotEqual(threads[1], threading.get_ident())
+
+    def test_offloaded_failure(self):
+        protect = flask_schema.decorators.SchemaProtect(Point, offload_size=0)
+        self.assertRaises(flask_schema.errors.WrongType, self.call, protect, {"x": "1"})
+
+    def test_process_executor(self):
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            protect = flask_schema.decorators.SchemaProtect(
+                Point, offload_size=0, executor=executor
+            )
+            self.assertEqual(self.call(protect, {"x": 1})[0], {"x": 1, "y": None})
+            self.assertRaises(
+                flask_schema.errors.WrongType, self.call, protect, {"x": "1"}
+            )
+
+    def test_process_executor_needs_schema(self):
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            self.assertRaises(
+                TypeError,
+                flask_schema.decorators.SchemaProtect,
+                flask_schema.types.Int(),
+                executor=executor,
+            )
+
+    def test_metrics(self):
+        sink = unittest.mock.Mock()
+        protect = flask_schema.decorators.SchemaProtect(
+            Point, offload_size=0, metrics=sink
+        )
+        self.call(protect, {"x": 1})
+        name, field, _, error = sink.call_args[0]
+        self.assertEqual((name, field, error), ("route", None, None))
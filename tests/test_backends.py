@@ -0,0 +1,97 @@
+import unittest
+import unittest.mock
+import flask
+import flask_schema.backends
+import flask_schema.decorators
+import flask_schema.errors
+import flask_schema.types
+
+
+class TestSchema(flask_schema.types.Schema):
+    test = flask_schema.types.Bool()
+
+
+def route(json_body):
+    return json_body
+
+
+class GetDecoderTest(unittest.TestCase):
+    def test_stdlib(self):
+        decode = flask_schema.backends.get_decoder("json")
+        self.assertEqual(decode(b'{"a": 1}'), {"a": 1})
+
+    def test_auto_prefers_fast_backend(self):
+        decode = flask_schema.backends.get_decoder("auto")
+        self.assertEqual(decode(b"[1]"), [1])
+
+    @unittest.skipIf(flask_schema.backends.orjson is None, "orjson not installed")
+    def test_orjson(self):
+        decode = flask_schema.backends.get_decoder("orjson")
+        self.assertEqual(decode(b'{"a": 1}'), {"a": 1})
+        self.assertRaises(flask_schema.errors.InvalidFormat, decode, b"{")
+
+    def test_missing_backend_falls_back_to_stdlib(self):
+        with unittest.mock.patch.dict(
+            flask_schema.backends._decoders, clear=True
+        ), unittest.mock.patch.dict(
+            flask_schema.backends.DECODERS,
+            {"json": flask_schema.backends.DECODERS["json"]},
+            clear=True,
+        ):
+            decode = flask_schema.backends.get_decoder("ujson")
+            self.assertEqual(decode(b"[1]"), [1])
+            self.assertRaises(flask_schema.errors.InvalidFormat, decode, b"[")
+
+    def test_callable(self):
+        decode = flask_schema.backends.get_decoder(lambda data: data.decode())
+        self.assertEqual(decode(b"raw"), "raw")
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, flask_schema.backends.get_decoder, "nope")
+
+    def test_cached(self):
+        self.assertIs(
+            flask_schema.backends.get_decoder("json"),
+            flask_schema.backends.get_decoder("json"),
+        )
+
+
+class SchemaProtectBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask("TestFlask")
+
+    def test_json_backend(self):
+        func = flask_schema.decorators.SchemaProtect(TestSchema, json_backend="auto")(
+            route
+        )
+        with self.app.test_request_context(method="POST", json={"test": True}):
+            self.assertEqual(func(), {"test": True})
+            self.assertEqual(flask.request.get_data(), b"")
+
+    def test_app_config(self):
+        decode = unittest.mock.Mock(return_value={"test": False})
+        self.app.config["SCHEMA_JSON_BACKEND"] = decode
+        func = flask_schema.decorators.SchemaProtect(TestSchema)(route)
+        with self.app.test_request_context(method="POST", json={"test": True}):
+            self.assertEqual(func(), {"test": False})
+        decode.assert_called_once_with(b'{"test": true}')
+
+    def test_not_json(self):
+        func = flask_schema.decorators.SchemaProtect(None, json_backend="json")(route)
+        with self.app.test_request_context(method="POST", data="x"):
+            self.assertIsNone(func())
+
+    def test_malformed(self):
+        for backend in (None, "json"):
+            func = flask_schema.decorators.SchemaProtect(True, json_backend=backend)(
+                route
+            )
+            with self.app.test_request_context(
+                method="POST", data="{", content_type="application/json"
+            ):
+                self.assertRaises(flask_schema.errors.InvalidFormat, func)
+
+    def test_unknown_backend(self):
+        self.assertRaises(
+            ValueError, flask_schema.decorators.SchemaProtect, True, json_backend="x"
+        )
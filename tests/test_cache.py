@@ -0,0 +1,139 @@
+import unittest
+import unittest.mock
+import flask
+import flask_schema.types
+import flask_schema.cache
+import flask_schema.errors
+import flask_schema.decorators
+
+
+class Item(flask_schema.types.Schema):
+    name = flask_schema.types.String()
+    tags = flask_schema.types.Array(flask_schema.types.String())
+
+
+class Stamped(flask_schema.types.Schema):
+    name = flask_schema.types.String(default=lambda: "anonymous")
+
+
+class Bounded(flask_schema.types.Schema):
+    count = flask_schema.types.Int(max_value=lambda: 10)
+
+
+def route(json_body):
+    return json_body
+
+
+class CacheableTest(unittest.TestCase):
+    def test_static_schema(self):
+        self.assertTrue(flask_schema.cache.cacheable(Item()))
+
+    def test_callable_default(self):
+        self.assertFalse(flask_schema.cache.cacheable(Stamped()))
+
+    def test_callback(self):
+        prop = flask_schema.types.Int(callback=lambda value: value)
+        self.assertFalse(flask_schema.cache.cacheable(prop))
+
+    def test_callable_bounds(self):
+        self.assertFalse(flask_schema.cache.cacheable(Bounded()))
+
+    def test_nested(self):
+        prop = flask_schema.types.Array(
+            flask_schema.types.Choice([flask_schema.types.Object(Bounded), "x"])
+        )
+        self.assertFalse(flask_schema.cache.cacheable(prop))
+
+    def test_opaque_callable(self):
+        self.assertFalse(flask_schema.cache.cacheable(lambda value: value))
+
+
+class ValidationCacheTest(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = flask_schema.cache.ValidationCache(maxsize=2)
+        validate = unittest.mock.Mock(return_value={"a": [1]})
+        self.assertEqual(cache.get_or_validate("rule", b"{}", validate), {"a": [1]})
+        self.assertEqual(cache.get_or_validate("rule", b"{}", validate), {"a": [1]})
+        self.assertEqual(validate.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_returns_copies(self):
+        cache = flask_schema.cache.ValidationCache()
+        first = cache.get_or_validate("rule", b"{}", lambda: {"a": [1]})
+        first["a"].append(2)
+        self.assertEqual(cache.get_or_validate("rule", b"{}", None), {"a": [1]})
+
+    def test_keyed_on_rule(self):
+        cache = flask_schema.cache.ValidationCache()
+        cache.get_or_validate("one", b"{}", lambda: 1)
+        self.assertEqual(cache.get_or_validate("two", b"{}", lambda: 2), 2)
+
+    def test_lru_eviction(self):
+        cache = flask_schema.cache.ValidationCache(maxsize=2)
+        cache.get_or_validate("rule", b"1", lambda: 1)
+        cache.get_or_validate("rule", b"2", lambda: 2)
+        cache.get_or_validate("rule", b"1", None)
+        cache.get_or_validate("rule", b"3", lambda: 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_or_validate("rule", b"1", None), 1)
+        self.assertEqual(cache.get_or_validate("rule", b"2", lambda: "new"), "new")
+
+    @unittest.mock.patch("time.monotonic")
+    def test_ttl(self, monotonic):
+        cache = flask_schema.cache.ValidationCache(ttl=5)
+        monotonic.return_value = 100
+        cache.get_or_validate("rule", b"{}", lambda: 1)
+        monotonic.return_value = 104
+        self.assertEqual(cache.get_or_validate("rule", b"{}", lambda: 2), 1)
+        monotonic.return_value = 106
+        self.assertEqual(cache.get_or_validate("rule", b"{}", lambda: 2), 2)
+
+    def test_clear(self):
+        cache = flask_schema.cache.ValidationCache()
+        cache.get_or_validate("rule", b"{}", lambda: 1)
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+
+class SchemaProtectCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask("TestFlask")
+
+    def test_cached_body(self):
+        protect = flask_schema.decorators.SchemaProtect(Item, cache_size=8)
+        func = protect(route)
+        for _ in range(3):
+            body = {"name": "a", "tags": ["x"]}
+            with self.app.test_request_context(method="POST", json=body):
+                self.assertEqual(func(), body)
+        self.assertEqual((protect.cache.hits, protect.cache.misses), (2, 1))
+
+    def test_bypassed_for_non_json(self):
+        protect = flask_schema.decorators.SchemaProtect(Item, cache_size=8)
+        with self.app.test_request_context(method="POST", json={"name": "a"}):
+            protect(route)()
+        with self.app.test_request_context(
+            method="POST", data='{"name": "a"}', content_type="text/plain"
+        ):
+            self.assertRaises(flask_schema.errors.NotNullable, protect(route))
+        self.assertEqual((protect.cache.hits, len(protect.cache)), (0, 1))
+
+    def test_failures_are_not_cached(self):
+        protect = flask_schema.decorators.SchemaProtect(Item, cache_size=8)
+        for _ in range(2):
+            with self.app.test_request_context(method="POST", json={"name": 1}):
+                self.assertRaises(flask_schema.errors.WrongType, protect(route))
+        self.assertEqual(len(protect.cache), 0)
+
+    def test_bypassed_for_dynamic_schema(self):
+        protect = flask_schema.decorators.SchemaProtect(Stamped, cache_size=8)
+        self.assertIsNone(protect.cache)
+
+    def test_not_combined_with_stream(self):
+        self.assertRaises(
+            ValueError,
+            flask_schema.decorators.SchemaProtect,
+            Item,
+            stream=True,
+            cache_size=8,
+        )
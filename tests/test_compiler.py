@@ -0,0 +1,126 @@
+import unittest
+import unittest.mock
+import copy
+import datetime
+import flask_schema.types
+import flask_schema.errors
+import flask_schema.compiler
+import flask_schema.decorators
+
+
+class Item(flask_schema.types.Schema):
+    name = flask_schema.types.String(min_length=1, max_length=5, nullable=False)
+    count = flask_schema.types.Int(min_value=0, default=0)
+    price = flask_schema.types.Float(max_value=lambda: 100)
+
+
+class Order(flask_schema.types.Schema):
+    __strict__ = True
+    id = flask_schema.types.Uuid(nullable=False)
+    paid = flask_schema.types.Bool(default=False)
+    items = flask_schema.types.Array(
+        flask_schema.types.Object(Item), min_length=1, max_length=3
+    )
+    tags = flask_schema.types.Array(flask_schema.types.String(max_length=3))
+    placed = flask_schema.types.Date()
+    total = flask_schema.types.Number(callback=lambda v: v * 2)
+    anything = flask_schema.types.Property()
+
+
+def valid_order(**kwargs):
+    order = {
+        "id": "8a2f0c0e-56b1-4b1c-9f5e-0d9d6c9f1a2b",
+        "items": [{"name": "a", "count": 2, "price": 1.5}, {"name": "b"}],
+        "tags": ["x", "yz", None],
+        "placed": "2018-12-26",
+        "total": 4,
+        "anything": {"nested": True},
+    }
+    order.update(kwargs)
+    return order
+
+
+class CompilerTest(unittest.TestCase):
+    def assertSameResult(self, schema, value):
+        compiled = schema.compile()
+        try:
+            expected = schema()(copy.deepcopy(value))
+        except flask_schema.errors.SchemaValidationError as ex:
+            with self.assertRaises(type(ex)) as context:
+                compiled(copy.deepcopy(value))
+            self.assertEqual(str(context.exception), str(ex))
+        else:
+            self.assertEqual(compiled(copy.deepcopy(value)), expected)
+
+    def test_valid(self):
+        self.assertSameResult(Order, valid_order())
+
+    def test_defaults(self):
+        self.assertSameResult(Order, valid_order(paid=None, items=[{"name": "a"}]))
+
+    def test_bool_subclass_of_int(self):
+        self.assertSameResult(Order, valid_order(items=[{"name": "a", "count": True}]))
+
+    def test_wrong_type(self):
+        self.assertSameResult(Order, valid_order(tags=["x", 1]))
+
+    def test_out_of_range(self):
+        self.assertSameResult(Order, valid_order(items=[{"name": "abcdef"}]))
+
+    def test_callable_bound(self):
+        self.assertSameResult(Order, valid_order(items=[{"name": "a", "price": 101}]))
+
+    def test_array_length(self):
+        self.assertSameResult(Order, valid_order(items=[]))
+
+    def test_not_nullable(self):
+        self.assertSameResult(Order, valid_order(id=None))
+
+    def test_strict(self):
+        self.assertSameResult(Order, valid_order(nope=1))
+
+    def test_not_a_dict(self):
+        self.assertSameResult(Order, [])
+
+    def test_delegates_other_types(self):
+        result = Order.compile()(valid_order())
+        self.assertEqual(result["placed"], datetime.date(2018, 12, 26))
+        self.assertEqual(result["total"], 8)
+
+    def test_cached_per_class(self):
+        self.assertIs(Order.compile(), Order.compile())
+        self.assertIsNot(Order.compile(), Item.compile())
+
+    def test_compile_is_not_a_field(self):
+        self.assertNotIn("compile", Order().object.schema)
+
+    def test_compile_field_name(self):
+        class Clash(flask_schema.types.Schema):
+            compile = flask_schema.types.Int()
+
+        compiled = flask_schema.decorators.SchemaProtect._validator(Clash(), True)
+        self.assertEqual(compiled({"compile": 1}), {"compile": 1})
+        self.assertRaises(flask_schema.errors.WrongType, compiled, {"compile": "1"})
+
+    def test_scalar_is_not_compiled(self):
+        prop = flask_schema.types.Int()
+        self.assertIs(flask_schema.compiler.compile_property(prop), prop)
+
+    def test_compile_array(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(min_value=0))
+        compiled = flask_schema.compiler.compile_property(prop)
+        self.assertEqual(compiled([1, 2, 3]), [1, 2, 3])
+        self.assertRaises(flask_schema.errors.SchemaValidationError, compiled, [1, -1])
+        self.assertIsNone(compiled(None))
+
+    def test_dynamic_bound_resolved_once(self):
+        limit = unittest.mock.Mock(return_value=10)
+
+        class Limited(flask_schema.types.Schema):
+            count = flask_schema.types.Int(max_value=limit)
+
+        prop = flask_schema.types.Array(flask_schema.types.Object(Limited))
+        compiled = flask_schema.compiler.compile_property(prop)
+        self.assertEqual(compiled([{"count": 1}] * 20), [{"count": 1}] * 20)
+        self.assertEqual(limit.call_count, 1)
+        self.assertRaises(flask_schema.errors.OutOfRange, compiled, [{"count": 11}])
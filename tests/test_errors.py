@@ -0,0 +1,61 @@
+import unittest
+import pickle
+import flask_schema.errors
+
+
+class SchemaValidationErrorTest(unittest.TestCase):
+    def test_defaults(self):
+        error = flask_schema.errors.SchemaValidationError()
+        self.assertEqual(error.code, "invalid")
+        self.assertEqual(error.path, ())
+        self.assertEqual(error.errors, [])
+        self.assertEqual(error.constraints, {})
+
+    def test_pointer(self):
+        error = flask_schema.errors.SchemaValidationError(path=("a/b", 0, "c~d"))
+        self.assertEqual(error.pointer, "/a~1b/0/c~0d")
+
+    def test_at_prefixes_path(self):
+        error = flask_schema.errors.SchemaValidationError(path=("c",))
+        self.assertIs(error.at("a", 1), error)
+        self.assertEqual(error.path, ("a", 1, "c"))
+
+    def test_to_dict(self):
+        error = flask_schema.errors.SchemaValidationError(
+            code="out_of_range", path=("a",), minimum=1, maximum=2
+        )
+        self.assertEqual(
+            error.to_dict(),
+            {"path": "/a", "code": "out_of_range", "minimum": 1, "maximum": 2},
+        )
+
+    def test_collected_to_dict(self):
+        error = flask_schema.errors.SchemaValidationError.collected(
+            [flask_schema.errors.SchemaValidationError(code="wrong_type", path=("a",))]
+        )
+        self.assertEqual(
+            error.to_dict(),
+            {"code": "multiple", "errors": [{"path": "/a", "code": "wrong_type"}]},
+        )
+
+    def test_pickle(self):
+        error = flask_schema.errors.SchemaValidationError(
+            code="no_match", path=("a",), pattern="x"
+        )
+        loaded = pickle.loads(pickle.dumps(error))
+        self.assertEqual(loaded.to_dict(), error.to_dict())
+
+    def test_typed_errors(self):
+        for error_type, code in [
+            (flask_schema.errors.WrongType, "wrong_type"),
+            (flask_schema.errors.OutOfRange, "out_of_range"),
+            (flask_schema.errors.NotNullable, "not_nullable"),
+            (flask_schema.errors.NoMatch, "no_match"),
+            (flask_schema.errors.UnknownField, "unknown_field"),
+            (flask_schema.errors.InvalidChoice, "invalid_choice"),
+            (flask_schema.errors.InvalidFormat, "invalid_format"),
+        ]:
+            error = error_type()
+            self.assertIsInstance(error, flask_schema.errors.SchemaValidationError)
+            self.assertEqual(error.code, code)
+            self.assertEqual(str(error), code)
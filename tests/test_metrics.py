@@ -0,0 +1,109 @@
+import unittest
+import flask
+import flask_schema.types
+import flask_schema.errors
+import flask_schema.metrics
+import flask_schema.compiler
+import flask_schema.decorators
+
+registry = flask_schema.metrics.Registry(buckets=(0.5, 1.0))
+
+
+class Point(flask_schema.types.Schema):
+    __metrics__ = registry
+    x = flask_schema.types.Int(nullable=False)
+    y = flask_schema.types.Int(max_value=10)
+
+
+def route(json_body):
+    return json_body
+
+
+class RegistryTest(unittest.TestCase):
+    def setUp(self):
+        registry.clear()
+
+    def test_counts_schema_and_fields(self):
+        Point()({"x": 1, "y": 2})
+        self.assertEqual(
+            dict(registry.calls),
+            {("Point", None): 1, ("Point", "x"): 1, ("Point", "y"): 1},
+        )
+        self.assertEqual(dict(registry.failures), {})
+
+    def test_failures_by_code(self):
+        Point.validate({"x": 1, "y": 11})
+        Point.validate({"y": 1})
+        self.assertEqual(
+            dict(registry.failures),
+            {
+                ("Point", None, "out_of_range"): 1,
+                ("Point", "y", "out_of_range"): 1,
+                ("Point", None, "not_nullable"): 1,
+                ("Point", "x", "not_nullable"): 1,
+            },
+        )
+        self.assertEqual(registry.calls[("Point", "y")], 1)
+
+    def test_histogram(self):
+        registry("Shape", "side", 0.2, None)
+        registry("Shape", "side", 0.7, None)
+        registry("Shape", "side", 3.0, None)
+        self.assertEqual(registry.latency[("Shape", "side")], [1, 1, 1, 3.9])
+
+    def test_prometheus(self):
+        registry('Sha"pe', None, 0.2, flask_schema.errors.WrongType())
+        self.assertEqual(
+            registry.to_prometheus().splitlines(),
+            [
+                "# HELP flask_schema_validations_total Validation calls.",
+                "# TYPE flask_schema_validations_total counter",
+                'flask_schema_validations_total{schema="Sha\\"pe",field=""} 1',
+                "# HELP flask_schema_failures_total Validation failures by error code.",
+                "# TYPE flask_schema_failures_total counter",
+                'flask_schema_failures_total{schema="Sha\\"pe",field="",code="wrong_type"} 1',
+                "# HELP flask_schema_validation_seconds Validation latency.",
+                "# TYPE flask_schema_validation_seconds histogram",
+                'flask_schema_validation_seconds_bucket{schema="Sha\\"pe",field="",le="0.5"} 1',
+                'flask_schema_validation_seconds_bucket{schema="Sha\\"pe",field="",le="1.0"} 1',
+                'flask_schema_validation_seconds_bucket{schema="Sha\\"pe",field="",le="+Inf"} 1',
+                'flask_schema_validation_seconds_sum{schema="Sha\\"pe",field=""} 0.2',
+                'flask_schema_validation_seconds_count{schema="Sha\\"pe",field=""} 1',
+            ],
+        )
+
+    def test_callback_sink(self):
+        events = []
+        prop = flask_schema.types.Object(Point, metrics=lambda *e: events.append(e))
+        self.assertRaises(flask_schema.errors.WrongType, prop, {"x": "1"})
+        self.assertEqual(
+            [(schema, field, type(error)) for schema, field, _, error in events],
+            [
+                ("Point", "x", flask_schema.errors.WrongType),
+                ("Point", None, flask_schema.errors.WrongType),
+            ],
+        )
+
+    def test_compiled_schema_is_observed(self):
+        compiled = flask_schema.compiler.compile_property(Point().object)
+        self.assertEqual(compiled({"x": 1}), {"x": 1, "y": None})
+        self.assertEqual(registry.calls[("Point", None)], 1)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(flask_schema.types.Object(Point).metrics)
+
+
+class SchemaProtectMetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask("TestFlask")
+        registry.clear()
+
+    def test_request_level(self):
+        func = flask_schema.decorators.SchemaProtect(Point, metrics=registry)(route)
+        with self.app.test_request_context(method="POST", json={"x": 1}):
+            func()
+        with self.app.test_request_context(method="POST", json={"x": None}):
+            self.assertRaises(flask_schema.errors.NotNullable, func)
+        self.assertEqual(registry.calls[("route", None)], 2)
+        self.assertEqual(registry.failures[("route", None, "not_nullable")], 1)
+        self.assertEqual(registry.calls[("Point", None)], 2)
@@ -0,0 +1,105 @@
+import unittest
+import flask
+import flask_schema.types
+import flask_schema.errors
+import flask_schema.decorators
+
+
+class Event(flask_schema.types.Schema):
+    name = flask_schema.types.String(nullable=False)
+    count = flask_schema.types.Int(default=0)
+
+
+EVENTS = flask_schema.types.Array(Event, max_length=3)
+
+
+def route(records):
+    return list(records)
+
+
+class NdjsonTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask("TestFlask")
+
+    def post(self, data, **kwargs):
+        func = flask_schema.decorators.SchemaProtect(EVENTS, format="ndjson", **kwargs)
+        with self.app.test_request_context(
+            method="POST", data=data, content_type="application/x-ndjson"
+        ):
+            return func(route)()
+
+    def test_records(self):
+        self.assertEqual(
+            self.post(b'{"name": "a"}\n\n{"name": "b", "count": 2}'),
+            [{"name": "a", "count": 0}, {"name": "b", "count": 2}],
+        )
+
+    def test_empty_body(self):
+        self.assertEqual(self.post(b""), [])
+
+    def test_generator(self):
+        func = flask_schema.decorators.SchemaProtect(EVENTS, format="ndjson")
+        with self.app.test_request_context(
+            method="POST", data=b'{"name": "a"}\n{"name": 1}\n'
+        ):
+            records = func(lambda records: records)()
+            self.assertEqual(next(records), {"name": "a", "count": 0})
+            with self.assertRaises(flask_schema.errors.WrongType) as context:
+                next(records)
+        self.assertEqual(context.exception.pointer, "/1")
+
+    def test_malformed_line(self):
+        with self.assertRaises(flask_schema.errors.InvalidFormat) as context:
+            self.post(b'{"name": "a"}\n{"name"\n')
+        self.assertEqual(context.exception.pointer, "/1")
+
+    def test_max_length(self):
+        self.assertRaises(
+            flask_schema.errors.OutOfRange, self.post, b'{"name": "a"}\n' * 4
+        )
+
+    def test_min_length(self):
+        func = flask_schema.decorators.SchemaProtect(
+            flask_schema.types.Array(Event, min_length=1), format="ndjson"
+        )
+        with self.app.test_request_context(method="POST", data=b"\n"):
+            self.assertRaises(flask_schema.errors.OutOfRange, func(route))
+
+    def test_max_content_length(self):
+        self.assertRaises(
+            flask_schema.errors.TooLarge,
+            self.post,
+            b'{"name": "a"}\n' * 2,
+            max_content_length=20,
+        )
+
+    def test_compiled(self):
+        self.assertEqual(
+            self.post(b'{"name": "a"}', compiled=True), [{"name": "a", "count": 0}]
+        )
+
+    def test_through_client(self):
+        @self.app.route("/events", methods=["POST"])
+        @flask_schema.decorators.SchemaProtect(EVENTS, format="ndjson")
+        def events(records):
+            return flask.jsonify([record["name"] for record in records])
+
+        response = self.app.test_client().post(
+            "/events", data=b'{"name": "a"}\n{"name": "b"}\n'
+        )
+        self.assertEqual(response.get_json(), ["a", "b"])
+
+    def test_rule_must_be_array(self):
+        self.assertRaises(
+            TypeError, flask_schema.decorators.SchemaProtect, Event, format="ndjson"
+        )
+        self.assertRaises(
+            ValueError, flask_schema.decorators.SchemaProtect, EVENTS, format="xml"
+        )
+        self.assertRaises(
+            ValueError,
+            flask_schema.decorators.SchemaProtect,
+            EVENTS,
+            format="ndjson",
+            cache_size=8,
+        )
@@ -0,0 +1,166 @@
+import datetime
+import unittest
+import flask
+import flask_schema.types
+import flask_schema.errors
+import flask_schema.params
+import flask_schema.decorators
+
+
+class Search(flask_schema.types.Schema):
+    q = flask_schema.types.String(nullable=False)
+    page = flask_schema.types.Int(min_value=1, default=1)
+    ratio = flask_schema.types.Float()
+    score = flask_schema.types.Number()
+    exact = flask_schema.types.Bool(default=False)
+    since = flask_schema.types.Date()
+    tag = flask_schema.types.Array(flask_schema.types.Int())
+
+
+class StrictSearch(flask_schema.types.Schema):
+    __strict__ = True
+    q = flask_schema.types.String()
+
+
+class Client(flask_schema.types.Schema):
+    x_request_id = flask_schema.types.Uuid(nullable=False)
+    x_retries = flask_schema.types.Int(default=0)
+    accept = flask_schema.types.Array(flask_schema.types.String())
+    content_type = flask_schema.types.String()
+
+
+REQUEST_ID = "9689c6bd-8cfa-4888-a92c-7d23599b94aa"
+
+
+class QueryParamsTest(unittest.TestCase):
+    def setUp(self):
+        self.query = flask_schema.params.QueryParams(Search)
+
+    def test_coerces_declared_keys(self):
+        self.assertEqual(
+            self.query(
+                b"q=caf%C3%A9+au+lait&page=2&ratio=0.5&score=3&exact=true"
+                b"&since=2018-12-26&tag=1&tag=2&other=x"
+            ),
+            {
+                "q": "café au lait",
+                "page": 2,
+                "ratio": 0.5,
+                "score": 3,
+                "exact": True,
+                "since": datetime.date(2018, 12, 26),
+                "tag": [1, 2],
+            },
+        )
+
+    def test_defaults(self):
+        self.assertEqual(
+            self.query(b"q=x"),
+            {
+                "q": "x",
+                "page": 1,
+                "ratio": None,
+                "score": None,
+                "exact": False,
+                "since": None,
+                "tag": None,
+            },
+        )
+
+    def test_first_value_wins(self):
+        self.assertEqual(self.query(b"q=a&q=b")["q"], "a")
+
+    def test_conversion_error(self):
+        with self.assertRaises(flask_schema.errors.WrongType) as context:
+            self.query(b"q=x&tag=1&tag=two")
+        self.assertEqual(context.exception.pointer, "/tag")
+        self.assertRaises(flask_schema.errors.WrongType, self.query, b"q=x&exact=yes")
+        for query in (b"q=x&ratio=nan", b"q=x&score=inf", b"q=x&page=+7+"):
+            self.assertRaises(flask_schema.errors.WrongType, self.query, query)
+
+    def test_validation_error(self):
+        self.assertRaises(flask_schema.errors.OutOfRange, self.query, b"q=x&page=0")
+        self.assertRaises(flask_schema.errors.NotNullable, self.query, b"page=2")
+
+    def test_strict(self):
+        query = flask_schema.params.QueryParams(StrictSearch)
+        self.assertEqual(query(b"q=x"), {"q": "x"})
+        self.assertRaises(flask_schema.errors.UnknownField, query, b"q=x&other=1")
+
+    def test_not_a_schema(self):
+        self.assertRaises(
+            TypeError, flask_schema.params.QueryParams, flask_schema.types.Int()
+        )
+
+
+class HeaderParamsTest(unittest.TestCase):
+    def setUp(self):
+        self.headers = flask_schema.params.HeaderParams(Client)
+
+    def test_reads_environ(self):
+        self.assertEqual(
+            self.headers(
+                {
+                    "HTTP_X_REQUEST_ID": REQUEST_ID,
+                    "HTTP_X_RETRIES": "3",
+                    "HTTP_ACCEPT": "text/html, application/json",
+                    "CONTENT_TYPE": "application/json",
+                }
+            ),
+            {
+                "x_request_id": REQUEST_ID,
+                "x_retries": 3,
+                "accept": ["text/html", "application/json"],
+                "content_type": "application/json",
+            },
+        )
+
+    def test_error_uses_header_name(self):
+        with self.assertRaises(flask_schema.errors.WrongType) as context:
+            self.headers({"HTTP_X_REQUEST_ID": REQUEST_ID, "HTTP_X_RETRIES": "x"})
+        self.assertEqual(context.exception.pointer, "/x-retries")
+
+
+class SchemaProtectParamsTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask("TestFlask")
+
+        @self.app.route("/search", methods=["GET", "POST"])
+        @flask_schema.decorators.SchemaProtect(query=Search, headers=Client)
+        def search(body, query, headers):
+            return flask.jsonify(
+                body=body, page=query["page"], retries=headers["x_retries"]
+            )
+
+        @self.app.errorhandler(flask_schema.errors.SchemaValidationError)
+        def invalid(ex):
+            return flask.jsonify(ex.to_dict()), 400
+
+        self.client = self.app.test_client()
+
+    def test_query_and_headers(self):
+        response = self.client.get(
+            "/search?q=x&page=3",
+            headers={"X-Request-Id": REQUEST_ID, "X-Retries": "2"},
+        )
+        self.assertEqual(response.get_json(), {"body": None, "page": 3, "retries": 2})
+
+    def test_with_body(self):
+        response = self.client.post(
+            "/search?q=x", json={"a": 1}, headers={"X-Request-Id": REQUEST_ID}
+        )
+        self.assertEqual(
+            response.get_json(), {"body": {"a": 1}, "page": 1, "retries": 0}
+        )
+
+    def test_invalid_header(self):
+        response = self.client.get("/search?q=x")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["code"], "not_nullable")
+
+    def test_compiled(self):
+        protect = flask_schema.decorators.SchemaProtect(query=Search, compiled=True)
+        with self.app.test_request_context("/search?q=x&tag=1"):
+            query = protect(lambda body, query: query)()
+            self.assertNotIn("args", vars(flask.request._get_current_object()))
+        self.assertEqual(query["tag"], [1])
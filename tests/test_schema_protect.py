@@ -71,3 +71,17 @@ class SchemaProtectTest(unittest.TestCase):
     def test_wrong_type(self):
         func = flask_schema.decorators.SchemaProtect(123)(route)
         self.assertRaises(flask_schema.errors.SchemaValidationError, func)
+
+    @unittest.mock.patch.object(
+        flask, "request", unittest.mock.Mock(json={"test": True})
+    )
+    def test_compiled(self):
+        func = flask_schema.decorators.SchemaProtect(TestSchema, compiled=True)(route)
+        self.assertEqual(func(), {"test": True})
+
+    @unittest.mock.patch.object(
+        flask, "request", unittest.mock.Mock(json={"nope": True})
+    )
+    def test_compiled_fails(self):
+        func = flask_schema.decorators.SchemaProtect(TestSchema, compiled=True)(route)
+        self.assertRaises(flask_schema.errors.SchemaValidationError, func)
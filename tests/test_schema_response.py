@@ -0,0 +1,109 @@
+import json
+import uuid
+import datetime
+import unittest
+import unittest.mock
+import flask
+import flask_schema.types
+import flask_schema.errors
+import flask_schema.decorators
+
+
+class Event(flask_schema.types.Schema):
+    id = flask_schema.types.Property(uuid.UUID)
+    at = flask_schema.types.DateTime(nullable=False)
+    day = flask_schema.types.Date()
+    count = flask_schema.types.Int(min_value=0)
+
+
+EVENT = {
+    "id": uuid.UUID("8a2f0c0e-56b1-4b1c-9f5e-0d9d6c9f1a2b"),
+    "at": datetime.datetime(2018, 12, 26, 1, 2, 3, tzinfo=datetime.timezone.utc),
+    "day": datetime.date(2018, 12, 26),
+    "count": 1,
+}
+
+EXPECTED = {
+    "id": "8a2f0c0e-56b1-4b1c-9f5e-0d9d6c9f1a2b",
+    "at": "2018-12-26T01:02:03+00:00",
+    "day": "2018-12-26",
+    "count": 1,
+}
+
+
+class SchemaResponseTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask("TestFlask")
+
+    def call(self, value, **kwargs):
+        func = flask_schema.decorators.SchemaResponse(Event, **kwargs)(lambda: value)
+        with self.app.test_request_context():
+            return func()
+
+    def test_serializes(self):
+        for backend in ("json", "auto"):
+            response = self.call(EVENT, json_backend=backend)
+            self.assertEqual(response.mimetype, "application/json")
+            self.assertEqual(json.loads(response.get_data()), EXPECTED)
+
+    def test_status_and_headers(self):
+        response = self.call((EVENT, 201, {"X-Test": "1"}))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.headers["X-Test"], "1")
+
+    def test_headers_without_status(self):
+        for headers in ({"X-Test": "1"}, [("X-Test", "1")]):
+            response = self.call((EVENT, headers))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["X-Test"], "1")
+            self.assertEqual(json.loads(response.get_data()), EXPECTED)
+
+    def test_validates(self):
+        self.assertRaises(
+            flask_schema.errors.OutOfRange, self.call, dict(EVENT, count=-1)
+        )
+
+    def test_sampling(self):
+        with unittest.mock.patch("random.random", return_value=0.5):
+            response = self.call(dict(EVENT, count=-1), sample_rate=0.1)
+            self.assertEqual(json.loads(response.get_data())["count"], -1)
+            self.assertRaises(
+                flask_schema.errors.OutOfRange,
+                self.call,
+                dict(EVENT, count=-1),
+                sample_rate=0.9,
+            )
+
+    def test_sampling_does_not_change_body(self):
+        value = {"id": EVENT["id"], "at": EVENT["at"], "password_hash": "x"}
+        bodies = {
+            self.call(value, sample_rate=rate, json_backend="json").get_data()
+            for rate in (0, 1)
+        }
+        self.assertEqual(len(bodies), 1)
+        self.assertIn(b"password_hash", bodies.pop())
+
+    def test_response_passthrough(self):
+        response = flask.Response("raw")
+        self.assertIs(self.call(response), response)
+
+    def test_response_tuple_passthrough(self):
+        response = self.call((flask.Response("raw"), 201, {"X-Test": "1"}))
+        self.assertEqual(response.get_data(), b"raw")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.headers["X-Test"], "1")
+
+    def test_array_buffer_values(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(), as_array="int64")
+        func = flask_schema.decorators.SchemaResponse(prop, json_backend="json")(
+            lambda: [1, 2]
+        )
+        with self.app.test_request_context():
+            self.assertEqual(json.loads(func().get_data()), [1, 2])
+
+    def test_unserializable(self):
+        func = flask_schema.decorators.SchemaResponse(
+            flask_schema.types.Property(), json_backend="json"
+        )(lambda: object())
+        with self.app.test_request_context():
+            self.assertRaises(TypeError, func)
@@ -0,0 +1,167 @@
+import io
+import json
+import time
+import unittest
+import flask
+import flask_schema.types
+import flask_schema.errors
+import flask_schema.stream
+import flask_schema.decorators
+
+
+class Item(flask_schema.types.Schema):
+    name = flask_schema.types.String(min_length=1)
+    count = flask_schema.types.Int(default=0)
+
+
+class Order(flask_schema.types.Schema):
+    __strict__ = True
+    id = flask_schema.types.Uuid(nullable=False)
+    items = flask_schema.types.Array(flask_schema.types.Object(Item), max_length=3)
+    note = flask_schema.types.String()
+    extra = flask_schema.types.Object(Item)
+    values = flask_schema.types.Array(flask_schema.types.Float(), as_array="float64")
+
+
+ORDER = {
+    "id": "8a2f0c0e-56b1-4b1c-9f5e-0d9d6c9f1a2b",
+    "items": [{"name": 'aé\\"b', "count": 2, "ignored": [1, {"x": None}]}],
+    "note": "café 😀 \n",
+    "extra": None,
+    "values": [1, 2.5e-3, -0.0],
+}
+
+
+class _Exploding(io.BytesIO):
+    def __init__(self, data, limit):
+        super(_Exploding, self).__init__(data)
+        self.limit = limit
+
+    def read(self, size=-1):
+        if self.tell() >= self.limit:
+            raise AssertionError("read past the first violation")
+        return super(_Exploding, self).read(size)
+
+
+def plain(order):
+    return dict(order, values=list(order["values"]))
+
+
+def validate(value, rule=Order, chunk_size=1, **kwargs):
+    data = value if isinstance(value, bytes) else json.dumps(value).encode()
+    return flask_schema.stream.validate(
+        io.BytesIO(data), rule(), chunk_size=chunk_size, **kwargs
+    )
+
+
+class StreamTest(unittest.TestCase):
+    def test_matches_interpreted(self):
+        for chunk_size in (1, 3, 65536):
+            self.assertEqual(
+                plain(validate(ORDER, chunk_size=chunk_size)),
+                plain(Order()(json.loads(json.dumps(ORDER)))),
+            )
+
+    def test_empty_body(self):
+        self.assertRaises(flask_schema.errors.NotNullable, validate, b"", Order)
+        self.assertIsNone(validate(b"  ", lambda: flask_schema.types.Array(Item)))
+
+    def test_scalar_rule(self):
+        self.assertEqual(validate(b"12", flask_schema.types.Int), 12)
+
+    def test_unknown_field_aborts_early(self):
+        data = b'{"nope": 1, "items": [' + b"{}, " * 10000 + b"{}]}"
+        stream = _Exploding(data, limit=64)
+        self.assertRaises(
+            flask_schema.errors.UnknownField,
+            flask_schema.stream.validate,
+            stream,
+            Order(),
+            chunk_size=16,
+        )
+
+    def test_max_length_aborts_early(self):
+        data = b'{"items": [' + b'{"name": "a"}, ' * 10000 + b'{"name": "a"}]}'
+        stream = _Exploding(data, limit=128)
+        self.assertRaises(
+            flask_schema.errors.OutOfRange,
+            flask_schema.stream.validate,
+            stream,
+            Order(),
+            chunk_size=16,
+        )
+
+    def test_invalid_character_aborts_early(self):
+        data = b'{"note": "ab\x01' + b"c" * 100000 + b'"}'
+        stream = _Exploding(data, limit=64)
+        self.assertRaises(
+            flask_schema.errors.InvalidFormat,
+            flask_schema.stream.validate,
+            stream,
+            Order(),
+            chunk_size=16,
+        )
+
+    def test_long_tokens_scale_linearly(self):
+        def elapsed(size):
+            data = b'{"note": "' + b"x" * size + b'", "values": [1.' + b"0" * size
+            data += b"]}"
+            start = time.perf_counter()
+            validate(data, flask_schema.types.Property, chunk_size=1024)
+            return time.perf_counter() - start
+
+        elapsed(1 << 16)
+        self.assertLess(min(elapsed(1 << 21) for _ in range(3)), elapsed(1 << 18) * 32)
+
+    def test_max_size(self):
+        self.assertRaises(flask_schema.errors.TooLarge, validate, ORDER, max_size=32)
+
+    def test_field_errors(self):
+        self.assertRaises(
+            flask_schema.errors.OutOfRange, validate, dict(ORDER, items=[{"name": ""}])
+        )
+        self.assertRaises(flask_schema.errors.WrongType, validate, dict(ORDER, items=1))
+
+    def test_malformed(self):
+        for data in [
+            b'{"id": }',
+            b'{"id" 1}',
+            b'{"items": [1 2]}',
+            b'{"note": "unterminated}',
+            b'{"note": nul}',
+            b'{"extra": {}} trailing',
+            b"\xff",
+            b"[01]",
+            b"[1.]",
+            b"[1e]",
+            b'{"x": "\\q"}',
+            b'{"x": "\\u12"}',
+            b'{"x": "\\',
+            b'{"x": "a\tb"}',
+        ]:
+            with self.assertRaises(flask_schema.errors.InvalidFormat, msg=data):
+                validate(data, flask_schema.types.Property)
+
+
+class SchemaProtectStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.app = flask.Flask("TestFlask")
+        self.func = flask_schema.decorators.SchemaProtect(
+            Order, stream=True, max_content_length=1024
+        )(lambda body: body)
+
+    def test_stream(self):
+        with self.app.test_request_context(method="POST", json=ORDER):
+            self.assertEqual(
+                plain(self.func()), plain(Order()(json.loads(json.dumps(ORDER))))
+            )
+
+    def test_not_json(self):
+        with self.app.test_request_context(method="POST", data="x"):
+            self.assertRaises(flask_schema.errors.NotNullable, self.func)
+
+    def test_content_length_too_large(self):
+        with self.app.test_request_context(
+            method="POST", json=dict(ORDER, note="x" * 2000)
+        ):
+            self.assertRaises(flask_schema.errors.TooLarge, self.func)
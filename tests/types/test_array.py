@@ -1,4 +1,7 @@
+import array
+import datetime
 import unittest
+import unittest.mock
 import flask_schema.types
 import flask_schema.errors
 
@@ -77,3 +80,158 @@ class ArrayTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flask_schema.types.Array(BasicSchema, callback=None)
         self.assertEqual(prop([{"thing": False}]), [{"thing": False}])
+
+    def test_collect_errors(self):
+        prop = flask_schema.types.Array(
+            flask_schema.types.Object(BasicSchema), collect_errors=True
+        )
+        with self.assertRaises(flask_schema.errors.SchemaValidationError) as context:
+            prop([{"thing": True}, {"thing": 1}, 2])
+        self.assertEqual(
+            [(e.pointer, e.code) for e in context.exception.errors],
+            [("/1/thing", "wrong_type"), ("/2", "wrong_type")],
+        )
+
+    def test_collect_errors_out_of_range(self):
+        prop = flask_schema.types.Array(
+            flask_schema.types.Bool, max_length=1, collect_errors=True
+        )
+        with self.assertRaises(flask_schema.errors.SchemaValidationError) as context:
+            prop([True, False])
+        self.assertEqual(context.exception.errors[0].to_dict()["maximum"], 1)
+
+    def test_collect_errors_valid(self):
+        prop = flask_schema.types.Array(BasicSchema, collect_errors=True)
+        self.assertEqual(prop([{"thing": True}]), [{"thing": True}])
+
+    def test_does_not_mutate_value(self):
+        prop = flask_schema.types.Array(BasicSchema)
+        value = [{"thing": True, "other": 1}]
+        self.assertEqual(prop(value), [{"thing": True}])
+        self.assertEqual(value, [{"thing": True, "other": 1}])
+
+    def test_bulk_scalar_items(self):
+        prop = flask_schema.types.Array(
+            flask_schema.types.Float(min_value=0, max_value=10)
+        )
+        self.assertTrue(prop.bulk)
+        value = [1, 2.5, 10]
+        self.assertEqual(prop(value), [1, 2.5, 10])
+        self.assertIsNot(prop(value), value)
+
+    def test_bulk_out_of_range(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(max_value=lambda: 3))
+        self.assertRaises(flask_schema.errors.OutOfRange, prop, [1, 2, 4])
+
+    def test_bulk_wrong_type(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int())
+        self.assertRaises(flask_schema.errors.WrongType, prop, [1, 2.0])
+
+    def test_bulk_nan(self):
+        prop = flask_schema.types.Array(flask_schema.types.Float(min_value=0))
+        self.assertRaises(flask_schema.errors.OutOfRange, prop, [1.0, float("nan")])
+
+    def test_bulk_string_lengths(self):
+        prop = flask_schema.types.Array(
+            flask_schema.types.String(min_length=1, max_length=2)
+        )
+        self.assertEqual(prop(["a", "bc"]), ["a", "bc"])
+        self.assertRaises(flask_schema.errors.OutOfRange, prop, ["a", ""])
+
+    def test_bulk_falls_back_for_nulls(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(default=0))
+        self.assertEqual(prop([1, None]), [1, 0])
+
+    def test_not_bulk_with_callback(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(callback=str))
+        self.assertFalse(prop.bulk)
+        self.assertEqual(prop([1]), ["1"])
+
+    def test_as_array(self):
+        prop = flask_schema.types.Array(flask_schema.types.Float(), as_array="float64")
+        result = prop([1.5, 2])
+        if flask_schema.types.numpy is None:
+            self.assertIsInstance(result, array.array)
+            self.assertEqual(result.typecode, "d")
+        else:
+            self.assertEqual(str(result.dtype), "float64")
+        self.assertEqual(list(result), [1.5, 2.0])
+
+    def test_as_array_stdlib_fallback(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(), as_array="int32")
+        with unittest.mock.patch.object(flask_schema.types, "numpy", None):
+            self.assertEqual(prop([1, 2, 3]), array.array("i", [1, 2, 3]))
+
+    def test_as_array_nulls(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(), as_array="int64")
+        self.assertRaises(flask_schema.errors.WrongType, prop, [1, None])
+
+    def test_as_array_overflow(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(), as_array="int8")
+        for numpy in (flask_schema.types.numpy, None):
+            with unittest.mock.patch.object(flask_schema.types, "numpy", numpy):
+                self.assertRaises(flask_schema.errors.OutOfRange, prop, [1, 1000])
+                self.assertRaises(flask_schema.errors.OutOfRange, prop, [-129])
+                self.assertEqual(list(prop([-128, 127])), [-128, 127])
+
+    def test_as_array_float_overflow(self):
+        prop = flask_schema.types.Array(flask_schema.types.Float(), as_array="float32")
+        for numpy in (flask_schema.types.numpy, None):
+            with unittest.mock.patch.object(flask_schema.types, "numpy", numpy):
+                self.assertRaises(flask_schema.errors.OutOfRange, prop, [1.0, 1e300])
+                self.assertRaises(flask_schema.errors.OutOfRange, prop, [-(10 ** 39)])
+                self.assertEqual(
+                    list(prop([1.5, float("inf")])), [1.5, float("inf")]
+                )
+
+    def test_as_array_item_errors(self):
+        prop = flask_schema.types.Array(
+            flask_schema.types.Int(min_value=0), as_array="int64", collect_errors=True
+        )
+        with self.assertRaises(flask_schema.errors.SchemaValidationError) as context:
+            prop([1, -1, "2"])
+        self.assertEqual([e.pointer for e in context.exception.errors], ["/1", "/2"])
+
+    def test_as_array_nullable(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(), as_array="int64")
+        self.assertIsNone(prop(None))
+
+    def test_as_array_unsupported(self):
+        self.assertRaises(
+            ValueError,
+            flask_schema.types.Array,
+            flask_schema.types.Int(),
+            as_array="complex128",
+        )
+        self.assertRaises(
+            TypeError,
+            flask_schema.types.Array,
+            flask_schema.types.Float(),
+            as_array="int64",
+        )
+        self.assertRaises(
+            TypeError,
+            flask_schema.types.Array,
+            flask_schema.types.Int(callback=abs),
+            as_array="int64",
+        )
+
+    def test_dynamic_bounds_resolved_once_per_call(self):
+        today = unittest.mock.Mock(return_value=datetime.date(2020, 1, 1))
+        prop = flask_schema.types.Array(flask_schema.types.Date(max_value=today))
+        self.assertEqual(len(prop(["2019-12-31"] * 50)), 50)
+        self.assertEqual(today.call_count, 1)
+        self.assertRaises(flask_schema.errors.OutOfRange, prop, ["2020-01-02"])
+        self.assertEqual(today.call_count, 2)
+
+    def test_dynamic_length_bounds(self):
+        prop = flask_schema.types.Array(
+            flask_schema.types.String(max_length=lambda: 2), min_length=lambda: 1
+        )
+        self.assertEqual(prop(["ab"]), ["ab"])
+        self.assertRaises(flask_schema.errors.OutOfRange, prop, [])
+        self.assertRaises(flask_schema.errors.OutOfRange, prop, ["abc"])
+
+    def test_coerced_items(self):
+        prop = flask_schema.types.Array(flask_schema.types.Int(coerce=True))
+        self.assertEqual(prop(["1", 2, "3"]), [1, 2, 3])
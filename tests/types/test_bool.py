@@ -32,6 +32,14 @@ class BoolTest(unittest.TestCase):
         prop = flask_schema.types.Bool(default=lambda: True)
         self.assertEqual(prop(None), True)
 
+    def test_coerce(self):
+        prop = flask_schema.types.Bool(coerce=True)
+        self.assertIs(prop("true"), True)
+        self.assertIs(prop("False"), False)
+        self.assertIs(prop("1"), True)
+        self.assertIs(prop("0"), False)
+        self.assertRaises(flask_schema.errors.WrongType, prop, "yes")
+
     def test_wrong_type(self):
         prop = flask_schema.types.Bool(callback=None)
         self.assertRaises(flask_schema.errors.SchemaValidationError, prop, 12)
@@ -3,6 +3,16 @@ import flask_schema.types
 import flask_schema.errors
 
 
+class Cat(flask_schema.types.Schema):
+    type = flask_schema.types.Choice(["cat"])
+    lives = flask_schema.types.Int()
+
+
+class Dog(flask_schema.types.Schema):
+    type = flask_schema.types.Choice(["dog"])
+    good = flask_schema.types.Bool()
+
+
 class NumberTest(unittest.TestCase):
     def test_property_choice(self):
         prop = flask_schema.types.Choice(
@@ -55,3 +65,97 @@ class NumberTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flask_schema.types.Choice([1, 2, 3], callback=None)
         self.assertEqual(prop(1), 1)
+
+    def test_invalid_choice_error_type(self):
+        prop = flask_schema.types.Choice([1, 2, 3])
+        self.assertRaises(flask_schema.errors.InvalidChoice, prop, 4)
+
+    def test_failed_alternative_leaves_value_untouched(self):
+        class Thing(flask_schema.types.Schema):
+            thing = flask_schema.types.Bool()
+
+        prop = flask_schema.types.Choice(
+            [
+                flask_schema.types.Array(flask_schema.types.Object(Thing)),
+                flask_schema.types.Array(flask_schema.types.Property(dict)),
+            ]
+        )
+        value = [{"thing": True, "other": 1}, {"thing": "nope"}]
+        self.assertEqual(prop(value), [{"thing": True, "other": 1}, {"thing": "nope"}])
+        self.assertEqual(value, [{"thing": True, "other": 1}, {"thing": "nope"}])
+
+    def test_discriminator_mapping(self):
+        prop = flask_schema.types.Choice(
+            {"cat": Cat, "dog": flask_schema.types.Object(Dog)}, discriminator="type"
+        )
+        self.assertEqual(prop({"type": "cat", "lives": 9}), {"type": "cat", "lives": 9})
+        self.assertEqual(
+            prop({"type": "dog", "good": True}), {"type": "dog", "good": True}
+        )
+
+    def test_discriminator_inferred(self):
+        prop = flask_schema.types.Choice([Cat, Dog], discriminator="type")
+        self.assertEqual(set(prop.tags), {"cat", "dog"})
+        self.assertEqual(
+            prop({"type": "dog", "good": True}), {"type": "dog", "good": True}
+        )
+
+    def test_discriminator_does_not_try_other_branches(self):
+        prop = flask_schema.types.Choice([Cat, Dog], discriminator="type")
+        self.assertRaises(
+            flask_schema.errors.WrongType, prop, {"type": "cat", "lives": "nine"}
+        )
+
+    def test_discriminator_unknown_tag(self):
+        prop = flask_schema.types.Choice([Cat, Dog], discriminator="type")
+        with self.assertRaises(flask_schema.errors.InvalidChoice) as context:
+            prop({"type": "bird"})
+        self.assertEqual(context.exception.pointer, "/type")
+        self.assertEqual(context.exception.constraints, {"allowed": ["cat", "dog"]})
+        self.assertRaises(flask_schema.errors.InvalidChoice, prop, {"type": []})
+
+    def test_discriminator_wrong_type(self):
+        prop = flask_schema.types.Choice([Cat, Dog], discriminator="type")
+        self.assertRaises(flask_schema.errors.WrongType, prop, ["cat"])
+
+    def test_discriminator_requires_literal_tag(self):
+        self.assertRaises(
+            TypeError,
+            flask_schema.types.Choice,
+            [flask_schema.types.Int()],
+            discriminator="type",
+        )
+
+    def test_literal_lookup_is_not_linear(self):
+        prop = flask_schema.types.Choice([str(i) for i in range(1000)])
+        self.assertEqual(prop.literals["999"], 999)
+        self.assertEqual(prop("999"), "999")
+        self.assertRaises(flask_schema.errors.InvalidChoice, prop, "1000")
+
+    def test_unhashable_literals(self):
+        prop = flask_schema.types.Choice([[1, 2], {"a": 1}, 3])
+        self.assertEqual(prop([1, 2]), [1, 2])
+        self.assertEqual(prop({"a": 1}), {"a": 1})
+        self.assertEqual(prop(3), 3)
+        self.assertRaises(flask_schema.errors.InvalidChoice, prop, [3])
+
+    def test_literal_before_property_wins(self):
+        prop = flask_schema.types.Choice(
+            [2, flask_schema.types.Int(callback=lambda v: v * 10)]
+        )
+        self.assertEqual(prop(2), 2)
+        self.assertEqual(prop(3), 30)
+
+    def test_property_before_literal_wins(self):
+        prop = flask_schema.types.Choice(
+            [flask_schema.types.Int(callback=lambda v: v * 10), 2, "a"]
+        )
+        self.assertEqual(prop(2), 20)
+        self.assertEqual(prop("a"), "a")
+
+    def test_unhashable_literal_before_hashable(self):
+        prop = flask_schema.types.Choice(
+            [[1], flask_schema.types.Int(callback=lambda v: v * 10), 1]
+        )
+        self.assertEqual(prop(1), 10)
+        self.assertEqual(prop([1]), [1])
@@ -108,3 +108,19 @@ class DateTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flask_schema.types.Date(callback=None)
         self.assertEqual(prop(self.epoc), self.epoc)
+
+    def test_error_types(self):
+        prop = flask_schema.types.Date()
+        self.assertRaises(flask_schema.errors.InvalidFormat, prop, "2018-13-01")
+        self.assertRaises(flask_schema.errors.WrongType, prop, [])
+
+    def test_fast_parser_matches_strptime(self):
+        for value in ["2018-12-26", "2018-1-26", "2018-02-30", "2018-W01-1"]:
+            try:
+                expected = flask_schema.types.Date._parse_strptime(value)
+            except ValueError:
+                self.assertRaises(
+                    ValueError, flask_schema.types.Date._parse_date, value
+                )
+            else:
+                self.assertEqual(flask_schema.types.Date._parse_date(value), expected)
@@ -1,4 +1,5 @@
 import unittest
+import unittest.mock
 import datetime
 import flask_schema.types
 import flask_schema.errors
@@ -137,3 +138,56 @@ class DateTimeTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flask_schema.types.DateTime(callback=None)
         self.assertEqual(prop(self.epoc), self.epoc)
+
+    # PARSER TESTS
+
+    def test_fast_parser_matches_strptime(self):
+        for value in [
+            "2018-12-26T00:00:00.000",
+            "2018-12-26T00:00:00.1-10:00",
+            "2018-12-26T00:00:00.123456Z",
+            "2018-12-26T00:00:00.000+00:00",
+            "2018-12-26T00:00:00.000-00:30",
+            "2018-12-26T00:00:00.000$10:00",
+            "2018-12-26T00:00:00.000+24:00",
+            "2018-12-26T24:00:00.000",
+            "2018-12-26T00:00:00",
+            "2018-12-26t00:00:00.000",
+            "2018-1-26T00:00:00.000",
+            "2018-02-30T00:00:00.000",
+            "2018-12-26T13:45:30.1\u06633456Z",
+            "2018-12-26T13:45:30.123+0\u0665:00",
+            "\uff12018-12-26T13:45:30.123",
+        ]:
+            try:
+                expected = flask_schema.types.DateTime._parse_strptime(value)
+            except ValueError:
+                self.assertRaises(
+                    ValueError, flask_schema.types.DateTime._parse_datetime, value
+                )
+            else:
+                parsed = flask_schema.types.DateTime._parse_datetime(value)
+                self.assertEqual(parsed, expected)
+                self.assertEqual(parsed.tzinfo, expected.tzinfo)
+
+    @unittest.mock.patch.object(flask_schema.types, "_datetime_fromisoformat", None)
+    def test_without_fromisoformat(self):
+        prop = flask_schema.types.DateTime()
+        self.assertEqual(
+            prop("2018-12-26T00:00:00.000+05:00"),
+            datetime.datetime(
+                2018,
+                12,
+                26,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=5)),
+            ),
+        )
+
+    @unittest.skipIf(
+        flask_schema.types._datetime_fromisoformat is None, "no fromisoformat"
+    )
+    def test_timezones_cached(self):
+        prop = flask_schema.types.DateTime()
+        first = prop("2018-12-26T00:00:00.000+05:30")
+        second = prop("2019-12-26T00:00:00.000+05:30")
+        self.assertIs(first.tzinfo, second.tzinfo)
@@ -65,6 +65,20 @@ class FloatTest(unittest.TestCase):
         prop = flask_schema.types.Float(default=lambda: 12)
         self.assertEqual(prop(None), 12)
 
+    def test_coerce(self):
+        prop = flask_schema.types.Float(coerce=True)
+        self.assertEqual(prop("1.5"), 1.5)
+        self.assertEqual(prop("2e3"), 2000.0)
+        self.assertRaises(flask_schema.errors.WrongType, prop, "one")
+        for value in ["nan", "inf", "1_000", " 7 ", "1e999"]:
+            self.assertRaises(flask_schema.errors.WrongType, prop, value)
+
+    def test_coerce_float_only(self):
+        prop = flask_schema.types.Property(float, coerce=True)
+        self.assertEqual(prop("7"), 7.0)
+        for value in ["nan", "-inf", "1_0", " 7", "\u0667"]:
+            self.assertRaises(flask_schema.errors.WrongType, prop, value)
+
     def test_wrong_type(self):
         prop = flask_schema.types.Float(callback=None)
         self.assertRaises(flask_schema.errors.SchemaValidationError, prop, "nope")
@@ -71,6 +71,15 @@ class IntTest(unittest.TestCase):
         prop = flask_schema.types.Int(default=lambda: 12)
         self.assertEqual(prop(None), 12)
 
+    def test_coerce(self):
+        prop = flask_schema.types.Int(coerce=True, max_value=20)
+        self.assertEqual(prop("12"), 12)
+        self.assertEqual(prop("-3"), -3)
+        self.assertRaises(flask_schema.errors.OutOfRange, prop, "21")
+        self.assertRaises(flask_schema.errors.WrongType, prop, "1.5")
+        for value in ["1_000", " 7 ", "+-1", "1e3", "\u0667"]:
+            self.assertRaises(flask_schema.errors.WrongType, prop, value)
+
     def test_wrong_type(self):
         prop = flask_schema.types.Int(callback=None)
         self.assertRaises(flask_schema.errors.SchemaValidationError, prop, "nope")
@@ -82,3 +91,9 @@ class IntTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flask_schema.types.Int(callback=None)
         self.assertEqual(prop(12), 12)
+
+    def test_out_of_range_error_type(self):
+        prop = flask_schema.types.Int(min_value=lambda: 1, max_value=3)
+        with self.assertRaises(flask_schema.errors.OutOfRange) as context:
+            prop(4)
+        self.assertEqual(context.exception.constraints, {"minimum": 1, "maximum": 3})
@@ -65,6 +65,22 @@ class NumberTest(unittest.TestCase):
         prop = flask_schema.types.Number(default=lambda: 12)
         self.assertEqual(prop(None), 12)
 
+    def test_coerce(self):
+        prop = flask_schema.types.Number(coerce=True)
+        self.assertEqual(prop("12"), 12)
+        self.assertIsInstance(prop("+12"), int)
+        self.assertEqual(prop("1.5"), 1.5)
+        self.assertRaises(flask_schema.errors.WrongType, prop, "-")
+
+    def test_coerce_strict(self):
+        prop = flask_schema.types.Number(coerce=True)
+        self.assertEqual(prop("-7"), -7)
+        self.assertEqual(prop("1.5e-3"), 0.0015)
+        for value in ["nan", "inf", "-Infinity", "1_000", " 7 ", "7\n", "1.", ".5"]:
+            self.assertRaises(flask_schema.errors.WrongType, prop, value)
+        self.assertRaises(flask_schema.errors.WrongType, prop, "1e999")
+        self.assertRaises(flask_schema.errors.WrongType, prop, "\u0667")
+
     def test_wrong_type(self):
         prop = flask_schema.types.Number(callback=None)
         self.assertRaises(flask_schema.errors.SchemaValidationError, prop, "nope")
@@ -7,6 +7,21 @@ class BasicSchema(flask_schema.types.Schema):
     thing = flask_schema.types.Bool()
 
 
+class CollectSchema(flask_schema.types.Schema):
+    thing = flask_schema.types.Bool()
+    count = flask_schema.types.Int(min_value=0)
+    nested = flask_schema.types.Object(BasicSchema)
+
+
+class LazySchema(flask_schema.types.Schema):
+    _calls = []
+    thing = flask_schema.types.Bool()
+    count = flask_schema.types.Int(min_value=0)
+    other = flask_schema.types.String(
+        callback=lambda v: LazySchema._calls.append(v) or v + "!"
+    )
+
+
 class ObjectTest(unittest.TestCase):
     def test_strict(self):
         prop = flask_schema.types.Object(BasicSchema, strict=True)
@@ -41,3 +56,65 @@ class ObjectTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flask_schema.types.Object(BasicSchema, callback=None)
         self.assertEqual(prop({"thing": False}), {"thing": False})
+
+    def test_collect_errors(self):
+        prop = flask_schema.types.Object(
+            CollectSchema, strict=True, collect_errors=True
+        )
+        with self.assertRaises(flask_schema.errors.SchemaValidationError) as context:
+            prop({"thing": 1, "count": -1, "nested": {"thing": "no"}, "other": 1})
+        self.assertEqual(context.exception.code, "multiple")
+        self.assertEqual(
+            [(e.pointer, e.code) for e in context.exception.errors],
+            [
+                ("/other", "unknown_field"),
+                ("/count", "out_of_range"),
+                ("/nested/thing", "wrong_type"),
+                ("/thing", "wrong_type"),
+            ],
+        )
+        self.assertEqual(context.exception.errors[1].constraints["minimum"], 0)
+
+    def test_collect_errors_valid(self):
+        prop = flask_schema.types.Object(CollectSchema, collect_errors=True)
+        self.assertEqual(
+            prop({"thing": True, "count": 1}),
+            {"thing": True, "count": 1, "nested": None},
+        )
+
+    def test_collect_errors_not_a_dict(self):
+        prop = flask_schema.types.Object(CollectSchema, collect_errors=True)
+        with self.assertRaises(flask_schema.errors.SchemaValidationError) as context:
+            prop(12)
+        self.assertEqual(
+            [(e.pointer, e.code) for e in context.exception.errors],
+            [("", "wrong_type")],
+        )
+
+    def test_lazy(self):
+        prop = flask_schema.types.Object(LazySchema, lazy=True)
+        result = prop({"thing": True, "other": "x", "count": -1})
+        self.assertIsInstance(result, flask_schema.types.LazyObject)
+        self.assertEqual(result["other"], "x!")
+        self.assertEqual(result["other"], "x!")
+        self.assertEqual(LazySchema._calls, ["x"])
+        self.assertRaises(flask_schema.errors.OutOfRange, result.__getitem__, "count")
+        self.assertRaises(KeyError, result.__getitem__, "nope")
+
+    def test_lazy_mapping(self):
+        prop = flask_schema.types.Object(BasicSchema, lazy=True)
+        result = prop({"thing": True})
+        self.assertEqual(list(result), ["thing"])
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result, {"thing": True})
+        self.assertEqual(result.validate_all(), {"thing": True})
+
+    def test_lazy_validate_all_fails(self):
+        prop = flask_schema.types.Object(BasicSchema, lazy=True)
+        result = prop({"thing": 1})
+        self.assertRaises(flask_schema.errors.WrongType, result.validate_all)
+
+    def test_lazy_strict_is_eager(self):
+        prop = flask_schema.types.Object(BasicSchema, lazy=True, strict=True)
+        self.assertRaises(flask_schema.errors.UnknownField, prop, {"other": 1})
+        self.assertRaises(flask_schema.errors.WrongType, prop, [])
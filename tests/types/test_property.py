@@ -43,3 +43,108 @@ class PropertyTest(unittest.TestCase):
     def test_no_callback(self):
         prop = flask_schema.types.Property(int, callback=None)
         self.assertEqual(prop(12), 12)
+
+    def test_not_nullable_error_type(self):
+        prop = flask_schema.types.Property(int, nullable=False)
+        self.assertRaises(flask_schema.errors.NotNullable, prop, None)
+
+    def test_wrong_type_error_type(self):
+        prop = flask_schema.types.Property(str)
+        with self.assertRaises(flask_schema.errors.WrongType) as context:
+            prop(12)
+        self.assertEqual(context.exception.constraints, {"expected": ["str"]})
+
+    def test_validate(self):
+        prop = flask_schema.types.Property(int, callback=lambda v: v * 2)
+        self.assertEqual(prop.validate(12), (True, 24, None))
+
+    def test_validate_fails(self):
+        prop = flask_schema.types.Property(int)
+        ok, value, error = prop.validate("12")
+        self.assertFalse(ok)
+        self.assertIsNone(value)
+        self.assertIsInstance(error, flask_schema.errors.WrongType)
+        self.assertIsNone(error.__traceback__)
+
+    def test_validate_matches_call(self):
+        def reject(value):
+            raise flask_schema.errors.NoMatch()
+
+        types = flask_schema.types
+        props = [
+            types.Property(int, nullable=False),
+            types.Property(int, default=lambda: 3),
+            types.Property(int, callback=reject),
+            types.Int(min_value=0, coerce=True),
+            types.Float(max_value=lambda: 1.5),
+            types.Bool(coerce=True),
+            types.String(min_length=2, default="x"),
+        ]
+        for prop in props:
+            for value in [None, 0, -1, 2.5, True, "1", "-1", "ab", "true", [1]]:
+                try:
+                    expected = (True, prop(value), None)
+                except flask_schema.errors.SchemaValidationError as ex:
+                    expected = (False, None, type(ex))
+                ok, result, error = prop.validate(value)
+                self.assertEqual((ok, result, error and type(error)), expected)
+                self.assertIsNone(error and error.__traceback__)
+
+    def test_validate_subclass_call(self):
+        class Odd(flask_schema.types.Int):
+            def __call__(self, value):
+                value = super(Odd, self).__call__(value)
+                if value % 2 == 0:
+                    raise flask_schema.errors.OutOfRange()
+                return value
+
+        ok, _, error = Odd().validate(2)
+        self.assertFalse(ok)
+        self.assertIsInstance(error, flask_schema.errors.OutOfRange)
+        self.assertEqual(Odd().validate(3), (True, 3, None))
+
+    def test_slots(self):
+        for prop in (
+            flask_schema.types.Property(int),
+            flask_schema.types.Int(),
+            flask_schema.types.Email(),
+            flask_schema.types.Uuid(),
+            flask_schema.types.Date(),
+            flask_schema.types.Array(flask_schema.types.Int()),
+        ):
+            self.assertFalse(hasattr(prop, "__dict__"), type(prop).__name__)
+
+    def test_subclass_without_slots(self):
+        class Tagged(flask_schema.types.String):
+            def __init__(self, tag, **kwargs):
+                super(Tagged, self).__init__(**kwargs)
+                self.tag = tag
+
+        prop = Tagged("label", max_length=3)
+        self.assertEqual(prop.tag, "label")
+        self.assertEqual(prop("abc"), "abc")
+        self.assertRaises(flask_schema.errors.OutOfRange, prop, "abcd")
+
+    def test_coerce(self):
+        prop = flask_schema.types.Property(int, coerce=True)
+        self.assertEqual(prop("12"), 12)
+        self.assertEqual(prop(12), 12)
+
+    def test_coerce_failure(self):
+        prop = flask_schema.types.Property(int, coerce=True)
+        with self.assertRaises(flask_schema.errors.WrongType) as context:
+            prop("twelve")
+        self.assertEqual(context.exception.constraints, {"expected": ["int"]})
+        self.assertRaises(flask_schema.errors.WrongType, prop, 1.5)
+
+    def test_coerce_before_callback(self):
+        prop = flask_schema.types.Property(int, coerce=True, callback=lambda v: v * 2)
+        self.assertEqual(prop("12"), 24)
+
+    def test_coerce_without_converter(self):
+        prop = flask_schema.types.Property(list, coerce=True)
+        self.assertRaises(flask_schema.errors.WrongType, prop, "[]")
+
+    def test_no_coerce_by_default(self):
+        prop = flask_schema.types.Property(int)
+        self.assertRaises(flask_schema.errors.WrongType, prop, "12")
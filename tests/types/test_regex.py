@@ -15,7 +15,33 @@ class RegexTest(unittest.TestCase):
         prop = flask_schema.types.Regex("ELL")
         self.assertRaises(flask_schema.errors.SchemaValidationError, prop, "nope")
 
-    # TODO test regex fail
+    def test_regex_fail_error_type(self):
+        prop = flask_schema.types.Regex("ELL")
+        with self.assertRaises(flask_schema.errors.NoMatch) as context:
+            prop("nope")
+        self.assertEqual(context.exception.constraints, {"pattern": "ELL"})
+
+    def test_prefix_match_by_default(self):
+        prop = flask_schema.types.Regex("HELL")
+        self.assertRaises(flask_schema.errors.NoMatch, prop, "OHELL")
+
+    def test_fullmatch(self):
+        prop = flask_schema.types.Regex("HELL", fullmatch=True)
+        self.assertEqual(prop("HELL"), "HELL")
+        self.assertRaises(flask_schema.errors.NoMatch, prop, "HELLO")
+
+    def test_required_characters(self):
+        prop = flask_schema.types.Regex("[a-z]+:[0-9]+", required=":")
+        self.assertEqual(prop("a:1"), "a:1")
+        with self.assertRaises(flask_schema.errors.NoMatch) as context:
+            prop("a1")
+        self.assertEqual(context.exception.constraints, {"pattern": "[a-z]+:[0-9]+"})
+
+    def test_match_length(self):
+        prop = flask_schema.types.Regex("[a-z]+", match_length=(2, 3))
+        self.assertEqual(prop("ab"), "ab")
+        self.assertRaises(flask_schema.errors.NoMatch, prop, "a")
+        self.assertRaises(flask_schema.errors.NoMatch, prop, "abcd")
 
     # PROPERTY TESTS
 
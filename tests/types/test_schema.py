@@ -0,0 +1,109 @@
+import unittest
+import unittest.mock
+import flask_schema.types
+import flask_schema.errors
+
+
+class Parent(flask_schema.types.Schema):
+    thing = flask_schema.types.Bool()
+
+
+class Child(Parent):
+    __strict__ = True
+    other = flask_schema.types.Int()
+
+
+class Collecting(Child):
+    __collect_errors__ = True
+
+
+class LazyParent(Parent):
+    __lazy__ = True
+
+
+class SchemaTest(unittest.TestCase):
+    def test_fields_computed_at_class_creation(self):
+        self.assertEqual(set(Parent._fields), {"thing"})
+
+    def test_fields_inherited(self):
+        self.assertEqual(set(Child._fields), {"thing", "other"})
+
+    def test_strict_inherited_per_class(self):
+        self.assertEqual(Parent()({"thing": True, "nope": 1}), {"thing": True})
+        self.assertRaises(
+            flask_schema.errors.SchemaValidationError, Child(), {"nope": 1}
+        )
+
+    def test_object_reused(self):
+        self.assertIs(Parent().object, Parent().object)
+        self.assertIsNot(Parent().object, Child().object)
+
+    def test_no_introspection_on_init(self):
+        Parent()
+        with unittest.mock.patch(
+            "flask_schema.types.dir", side_effect=AssertionError, create=True
+        ):
+            self.assertEqual(Parent()({"thing": False}), {"thing": False})
+            flask_schema.types.Object(Parent)
+
+    def test_base_schema(self):
+        self.assertEqual(flask_schema.types.Schema()({"anything": 1}), {})
+
+    def test_collect_errors(self):
+        with self.assertRaises(flask_schema.errors.SchemaValidationError) as context:
+            Collecting()({"thing": 1, "other": "2"})
+        self.assertEqual(
+            [e.pointer for e in context.exception.errors], ["/other", "/thing"]
+        )
+
+    def test_validate(self):
+        self.assertEqual(
+            Parent.validate({"thing": True}), (True, {"thing": True}, None)
+        )
+
+    def test_validate_fails(self):
+        ok, value, error = Child.validate({"nope": 1})
+        self.assertFalse(ok)
+        self.assertIsInstance(error, flask_schema.errors.UnknownField)
+        self.assertEqual(error.constraints, {"fields": ["nope"]})
+
+    def test_fields_named_like_helpers(self):
+        class Clash(flask_schema.types.Schema):
+            object = flask_schema.types.Int()
+            validate = flask_schema.types.String()
+            validate_many = flask_schema.types.Bool()
+
+        value = {"object": 1, "validate": "x", "validate_many": True}
+        self.assertEqual(Clash()(value), value)
+        self.assertEqual(
+            flask_schema.types.Object(Clash).validate(value), (True, value, None)
+        )
+        self.assertRaises(flask_schema.errors.WrongType, Clash(), {"object": "1"})
+
+    def test_lazy(self):
+        result = LazyParent()({"thing": 1})
+        self.assertIsInstance(result, flask_schema.types.LazyObject)
+        self.assertRaises(flask_schema.errors.WrongType, result.validate_all)
+
+    def test_validate_many(self):
+        results = Child.validate_many([{"other": 1}, {"other": "1"}, {"x": 1}])
+        self.assertEqual(next(results), (True, {"thing": None, "other": 1}, None))
+        ok, value, error = next(results)
+        self.assertEqual((ok, value, error.code), (False, None, "wrong_type"))
+        ok, value, error = next(results)
+        self.assertEqual((ok, value, error.code), (False, None, "unknown_field"))
+        self.assertRaises(StopIteration, next, results)
+
+    def test_validate_many_workers(self):
+        records = [{"other": i} if i % 3 else {"other": str(i)} for i in range(25)]
+        results = list(Child.validate_many(records, workers=2, chunk_size=4))
+        self.assertEqual(results[1], (True, {"thing": None, "other": 1}, None))
+        self.assertEqual([ok for ok, _, _ in results], [bool(i % 3) for i in range(25)])
+        self.assertIsInstance(results[0][2], flask_schema.errors.WrongType)
+
+    def test_validate_many_workers_needs_importable_schema(self):
+        class Local(flask_schema.types.Schema):
+            thing = flask_schema.types.Bool()
+
+        self.assertRaises(TypeError, Local.validate_many, [], workers=2)
+        self.assertRaises(TypeError, LazyParent.validate_many, [], workers=2)
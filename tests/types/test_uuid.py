@@ -19,6 +19,28 @@ class UuidTest(unittest.TestCase):
             "9689c6bd8cfa4888a92c7d23599b94aa",
         )
 
+    def test_accepted_forms(self):
+        prop = flask_schema.types.Uuid()
+        for value in (
+            "9689c6bd-8cfa-4888-a92c-7d23599b94aa",
+            "9689C6BD8CFA4888A92C7D23599B94AA",
+            "9689c6bd8cfa-4888a92c-7d23599b94aa",
+            "9689c6bd-8cfa-4888-a92c-7d23599b94aa\n",
+        ):
+            self.assertEqual(prop(value), value)
+
+    def test_rejected_forms(self):
+        prop = flask_schema.types.Uuid()
+        for value in (
+            "9689c6bd-8cfa-4888-a92c-7d23599b94ag",
+            "9689c6bd 8cfa 4888 a92c 7d23599b94aa",
+            "9689c6bd-8cfa-4888-a92c7-d23599b94aa",
+            "9689c6bd8cfa4888a92c7d23599b94 a",
+            "9689c6bd8cfa4888a92c7d23599b94é",
+            "",
+        ):
+            self.assertRaises(flask_schema.errors.NoMatch, prop, value)
+
     # PROPERTY TESTS
 
     def test_nullable_by_default(self):